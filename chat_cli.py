@@ -4,12 +4,17 @@ Spotify Agent - Interactive Chat CLI
 A chat-based command line interface for music recommendations using GPT
 """
 
+import os
+import re
 import sys
+import json
 import time
+import hashlib
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Dict, Any
-from spotify_client import SpotifyClient
-from openai_client import OpenAIClient
+from typing import List, Dict, Any, Iterator
 from data_processor import DataProcessor
 from logging_config import (
     get_logger,
@@ -23,67 +28,194 @@ from logging_config import (
 # Get configured logger
 logger = get_logger('chat_cli')
 
+# Number of recent user/assistant messages kept verbatim in the conversation
+MAX_RECENT_MESSAGES = 12
+
+# Share of the model's context window at which older turns are summarized
+COMPACTION_THRESHOLD = 0.8
+
+# Number of most recent messages left untouched by a compaction
+MESSAGES_KEPT_VERBATIM = 6
+
+# Limits on the running summary of compacted turns, so it stays a small,
+# bounded part of every request no matter how often compaction runs
+SUMMARY_MAX_REQUESTS = 10
+SUMMARY_MAX_RECOMMENDED = 50
+
+# Static conversation prefix saved between sessions so a quick relaunch
+# resends byte-identical context while OpenAI's prompt cache is still warm
+CONTEXT_CACHE_PATH = os.path.join(os.path.expanduser('~'), '.spotify_agent', 'prefix.json')
+CONTEXT_CACHE_MAX_AGE = 5 * 60
+
 
 class SpotifyAgentCLI:
     """
     Interactive CLI for Spotify Agent with conversation context
     """
     
+    # Inputs that end the chat session
+    EXIT_COMMANDS = frozenset({'exit', 'quit', 'bye', 'goodbye'})
+    
+    # Keywords that suggest music recommendations
+    _REC_INDICATORS = (
+        'song', 'track', 'music', 'artist', 'album', 'recommend', 
+        'suggest', 'playlist', 'listen', 'by ', 'ft.', 'feat.'
+    )
+    
+    # Patterns that suggest a list of songs, compiled once at class load
+    _LIST_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE | re.MULTILINE) for pattern in (
+        r'\d+\.\s*["\'""].*["\'""].*by\s+',     # 1. "Song" by Artist
+        r'\d+\.\s*.*\s*-\s*.*',                 # 1. Song - Artist
+        r'•\s*.*by\s+.*',                        # • Song by Artist
+        r'\*\*.*by\s+.*\*\*',                   # **Song by Artist**
+        r'\d+\.\s*Song:\s*["\'""].*["\'""]',    # 1. Song: "Title"
+        r'\d+\.\s*Song:\s*.*\n.*Artist:\s*.*',  # Multi-line Song:/Artist: format
+        r'Song:\s*["\'""].*["\'""].*Artist:',   # Song: "Title" Artist: Name
+        r'\d+\.\s*["\'""].*["\'""].*\n.*Artist:', # 1. "Song"\n   Artist: Name
+    ))
+    
+    # Numbered lists containing both "Song:" and "Artist:" (may span lines)
+    _SONG_ARTIST_PATTERN = re.compile(
+        r'\d+\.\s*Song:.*Artist:', re.IGNORECASE | re.MULTILINE | re.DOTALL
+    )
+    
+    # Single words that accept the playlist offer, matched as whole words
+    _AFFIRMATIVE_WORDS = frozenset({
+        'yes', 'yeah', 'yep', 'yup', 'sure', 'ok', 'okay', 'please',
+        'absolutely', 'definitely'
+    })
+    
+    # Multi-word phrases that accept the playlist offer
+    _AFFIRMATIVE_PHRASES = (
+        'go ahead', 'do it', 'of course', 'create it', 'make it', 'add them'
+    )
+    
+    _WORD_PATTERN = re.compile(r"[a-z']+")
+    
+    # "Song" by Artist mentions, used when summarizing earlier turns
+    _MENTION_PATTERN = re.compile(r'["“]([^"”\n]+)["”]\s+by\s+([^\n*(\-–—]+)')
+    
     def __init__(self):
         """Initialize the CLI with clients and conversation history"""
         self.spotify_client = None
         self.openai_client = None
-        self.conversation_history = []
-        self.exit_commands = ['exit', 'quit', 'bye', 'goodbye']
+        # Conversation sent to OpenAI: an append-only prefix of system context,
+        # one summary of compacted turns, then a bounded window of recent turns
+        self.context_messages = []
+        self.recent_messages = deque(maxlen=MAX_RECENT_MESSAGES)
+        self.summary_requests = deque(maxlen=SUMMARY_MAX_REQUESTS)
+        self.summary_recommended = {}
+        self.prompt_cache_key = None
+        self.user_message_count = 0
+        self.assistant_message_count = 0
+        
+        # Spotify searches started while a response streams, keyed by (track, artist)
+        self.search_executor = ThreadPoolExecutor(max_workers=4)
+        self.pending_searches = {}
         self.session_start_time = datetime.now()
+        self.debug = bool(os.environ.get("SPOTIFY_AGENT_DEBUG"))
         
-        # Initialize data processor for historical data
+        # Initialize data processor for historical data; historical_data holds
+        # the formatted 2024 chunk, loaded once and reused for the context
         self.data_processor = None
         self.historical_data = None
         
+    def _restore_context_prefix(self, prompt_cache_key: str) -> bool:
+        """
+        Reuse the static conversation prefix saved by a recent session
+        
+        The prefix holds a Spotify profile, so it is only restored for the
+        same Spotify user, identified by the prompt cache key.
+        
+        Args:
+            prompt_cache_key (str): Cache key of the connected Spotify user
+            
+        Returns:
+            bool: True if the saved prefix was restored
+        """
+        try:
+            age = time.time() - os.path.getmtime(CONTEXT_CACHE_PATH)
+            if age > CONTEXT_CACHE_MAX_AGE:
+                return False
+            
+            with open(CONTEXT_CACHE_PATH, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+            
+            if saved.get('prompt_cache_key') != prompt_cache_key:
+                return False
+            
+            self.context_messages = list(saved['static'])
+            self.prompt_cache_key = prompt_cache_key
+            logger.info(f"Restored conversation prefix saved {age:.0f}s ago")
+            return True
+            
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable conversation prefix cache: {e}")
+            return False
+    
+    def _save_context_prefix(self):
+        """Save the static conversation prefix for the next session"""
+        try:
+            os.makedirs(os.path.dirname(CONTEXT_CACHE_PATH), exist_ok=True)
+            with open(CONTEXT_CACHE_PATH, 'w', encoding='utf-8') as f:
+                json.dump({
+                    "static": self.context_messages,
+                    "prompt_cache_key": self.prompt_cache_key
+                }, f)
+        except Exception as e:
+            logger.warning(f"Could not save conversation prefix cache: {e}")
+    
     def initialize_clients(self):
         """Initialize Spotify and OpenAI clients"""
         try:
             print("🎵 Initializing Spotify Agent...")
             print("=" * 50)
             
-            # Initialize OpenAI Client (required)
+            # The historical data does not depend on OpenAI or Spotify, so it
+            # loads in the background while they connect
             print("🤖 Connecting to OpenAI...")
-            self.openai_client = OpenAIClient()
+            print("📊 Loading historical listening data...")
+            data_future = self._start_historical_data_load()
             
-            if not self.openai_client.test_connection():
+            # OpenAI Client (required)
+            if not self._connect_openai():
                 print("❌ Failed to connect to OpenAI")
                 return False
             
             print("✅ OpenAI connection successful!")
             
-            # Initialize data processor and load historical data FIRST
-            print("📊 Loading historical listening data...")
-            try:
-                self.data_processor = DataProcessor()
-                self.historical_data = self.data_processor.load_all_data()
-                print("✅ Historical data loaded successfully!")
-            except Exception as e:
-                print(f"⚠️  Historical data unavailable: {e}")
-                print("🎵 Continuing without historical data...")
-                self.data_processor = None
-                self.historical_data = None
-            
-            # Initialize Spotify Client (optional)
+            # Spotify Client (optional). It connects on this thread, since the
+            # OAuth flow may prompt the user
             print("📡 Connecting to Spotify...")
             try:
-                self.spotify_client = SpotifyClient()
-                if self.spotify_client.test_connection():
-                    print("✅ Spotify connection successful!")
-                    self._load_spotify_context()
-                else:
+                spotify_connected = self._connect_spotify()
+                if not spotify_connected:
                     print("⚠️  Spotify connection failed - continuing without Spotify data")
                     self.spotify_client = None
             except Exception as e:
                 print(f"⚠️  Spotify unavailable: {e}")
                 print("🎵 Continuing with OpenAI only...")
+                spotify_connected = False
                 self.spotify_client = None
             
+            # Historical data (optional)
+            try:
+                data_future.result()
+                print("✅ Historical data loaded successfully!")
+            except Exception as e:
+                print(f"⚠️  Historical data unavailable: {e}")
+                print("🎵 Continuing without historical data...")
+                self.data_processor = None
+                self.historical_data = None
+            
+            # The Spotify context includes the historical data, so it is
+            # loaded once both are available
+            if spotify_connected:
+                print("✅ Spotify connection successful!")
+                self._load_spotify_context()
+            
             return True
             
         except Exception as e:
@@ -91,26 +223,91 @@ class SpotifyAgentCLI:
             logger.error(f"Failed to initialize clients: {e}")
             return False
     
+    def _connect_openai(self) -> bool:
+        """Create the OpenAI client and test the connection"""
+        # Imported here so the openai SDK is only loaded once a session starts
+        from openai_client import OpenAIClient
+        self.openai_client = OpenAIClient()
+        return self.openai_client.test_connection()
+    
+    def _start_historical_data_load(self) -> Future:
+        """
+        Load the historical data on a daemon thread
+        
+        A daemon thread is used instead of an executor so that exiting after a
+        failed OpenAI connection does not wait for the load to finish.
+        
+        Returns:
+            Future: Completes when the data is loaded, or holds the load error
+        """
+        future = Future()
+        
+        def load():
+            future.set_running_or_notify_cancel()
+            try:
+                self._load_historical_data()
+                future.set_result(None)
+            except Exception as e:
+                future.set_exception(e)
+        
+        threading.Thread(target=load, name="historical-data", daemon=True).start()
+        return future
+    
+    def _load_historical_data(self):
+        """Create the data processor and load the 2024 listening data chunk"""
+        self.data_processor = DataProcessor()
+        # Only the 2024 chunk is used, so the library export is never parsed
+        self.historical_data = self.data_processor.load_2024_chunk(limit=30)
+    
+    def _connect_spotify(self) -> bool:
+        """Create the Spotify client and test the connection"""
+        # Imported here so spotipy/requests are only loaded once a session starts
+        from spotify_client import SpotifyClient
+        self.spotify_client = SpotifyClient()
+        return self.spotify_client.test_connection()
+    
     def _load_spotify_context(self):
         """Load user's Spotify context at session start"""
         try:
             if not self.spotify_client:
                 return
             
+            # Route this user's requests to the same prompt cache across sessions
+            prompt_cache_key = None
+            if self.spotify_client.user_id:
+                prompt_cache_key = hashlib.sha256(
+                    self.spotify_client.user_id.encode('utf-8')
+                ).hexdigest()[:32]
+            
+            # A prefix saved by a recent session for the same user is resent
+            # unchanged; Spotify is only queried when it is stale
+            if prompt_cache_key and self._restore_context_prefix(prompt_cache_key):
+                print("\n✅ Spotify context restored from your last session!")
+                return
+            
+            self.context_messages = []
+            self.prompt_cache_key = prompt_cache_key
+            
             print("\n📊 Loading your Spotify profile...")
             
-            # Get recent tracks and top artists
-            recent_tracks = self.spotify_client.get_recent_tracks(limit=30)
-            top_artists = self.spotify_client.get_top_artists(limit=30)
+            # Get recent tracks and top artists concurrently - both are
+            # independent network round-trips
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                recent_future = executor.submit(self.spotify_client.get_recent_tracks, limit=30)
+                top_future = executor.submit(self.spotify_client.get_top_artists, limit=30)
+                recent_tracks = recent_future.result()
+                top_artists = top_future.result()
             
             if recent_tracks or top_artists:
                 context_prompt = self._format_spotify_context(recent_tracks, top_artists)
                 
-                # Add Spotify context to conversation history
-                self.conversation_history.append({
+                # Add Spotify context to the conversation prefix. This message
+                # is part of the cached prefix, so it is never edited afterwards.
+                self.context_messages.append({
                     "role": "system",
                     "content": f"User's Spotify Context: {context_prompt}"
                 })
+                self._save_context_prefix()
                 
                 print("✅ Spotify context loaded!")
                 print(f"📋 Found {len(recent_tracks)} recent tracks and {len(top_artists)} top artists")
@@ -118,7 +315,7 @@ class SpotifyAgentCLI:
                 # Show historical data info
                 if self.data_processor and self.historical_data:
                     try:
-                        data_2024 = self.data_processor.load_2024_chunk(limit=30)
+                        data_2024 = self.historical_data
                         track_count = len(data_2024['recent_tracks'].split(", ")) if data_2024['recent_tracks'] else 0
                         artist_count = len(data_2024['top_artists'].split(", ")) if data_2024['top_artists'] else 0
                         genre_count = len(data_2024['top_genres'].split(", ")) if data_2024['top_genres'] else 0
@@ -141,25 +338,26 @@ class SpotifyAgentCLI:
         
         # Current Spotify data
         if recent_tracks:
-            # Create a dictionary to track unique tracks using track+artist as key
-            unique_tracks = {}
-            for track in recent_tracks:
-                track_key = f"{track['name']} by {track['artist']}"
-                if track_key not in unique_tracks:
-                    unique_tracks[track_key] = track
-            
-            # Join only the unique tracks
-            tracks_text = ", ".join(unique_tracks.keys())
+            # Deduplicate tracks in one pass, keyed by "track by artist"
+            unique_tracks = dict.fromkeys(
+                f"{track['name']} by {track['artist']}" for track in recent_tracks
+            )
+            
+            # Join only the unique tracks, sorted so the same Spotify state
+            # always produces the same context text
+            tracks_text = ", ".join(sorted(unique_tracks))
             context_parts.append(f"Recent tracks: {tracks_text}")
 
         if top_artists:
-            artists_text = ", ".join([artist['name'] for artist in top_artists])
+            # Deduplicate and sort artists the same way as tracks so the
+            # context text is byte-identical whenever the artist set is
+            artists_text = ", ".join(sorted(dict.fromkeys(artist['name'] for artist in top_artists)))
             context_parts.append(f"Top artists: {artists_text}")
         
         # Historical 2024 data
         if self.data_processor and self.historical_data:
             try:
-                data_2024 = self.data_processor.load_2024_chunk(limit=30)
+                data_2024 = self.historical_data
                 
                 if data_2024['recent_tracks']:
                     context_parts.append(f"2024 tracks: {data_2024['recent_tracks']}")
@@ -198,8 +396,8 @@ class SpotifyAgentCLI:
     
     def display_conversation_stats(self):
         """Display conversation statistics"""
-        user_messages = len([msg for msg in self.conversation_history if msg['role'] == 'user'])
-        assistant_messages = len([msg for msg in self.conversation_history if msg['role'] == 'assistant'])
+        user_messages = self.user_message_count
+        assistant_messages = self.assistant_message_count
         session_duration = datetime.now() - self.session_start_time
         
         print(f"\n📊 Session Stats:")
@@ -221,7 +419,7 @@ class SpotifyAgentCLI:
     
     def is_exit_command(self, user_input: str) -> bool:
         """Check if user wants to exit"""
-        return user_input.lower() in self.exit_commands
+        return user_input.lower() in self.EXIT_COMMANDS
     
     def validate_input(self, user_input: str) -> bool:
         """Validate user input"""
@@ -236,33 +434,44 @@ class SpotifyAgentCLI:
         return True
     
     def process_user_message(self, user_input: str) -> str:
-        """Process user message and get GPT response"""
+        """Process user message and stream the GPT response to the terminal"""
         try:
+            # Searches prefetched for the previous response no longer apply
+            self.pending_searches = {}
+            
             # Add user message to conversation history
-            self.conversation_history.append({
+            self.recent_messages.append({
                 "role": "user",
                 "content": user_input
             })
+            self.user_message_count += 1
             
-            # Create context-aware prompt
-            full_prompt = self._build_context_prompt(user_input)
-            print("Debug: About to send the following to GPT:")
-            # Print the full context being sent to GPT
-            print("\n📝 Full Context being sent to GPT:")
-            print("=" * 50)
-            print(full_prompt)
-            print("=" * 50)
-            print()
+            # Summarize older turns if the conversation is nearing the context window
+            self._maybe_compact()
+            messages = self._conversation_messages()
+            
+            # Log the full context being sent to GPT only when debugging;
+            # it can be kilobytes per turn and contains the Spotify profile
+            if self.debug:
+                logger.debug("Full context being sent to GPT:\n%s", "\n".join(
+                    f"{msg['role'].title()}: {msg['content']}" for msg in messages
+                ))
             
-            # Get response from OpenAI
+            # Stream response from OpenAI as it is generated
             logger.info(f"User input: {user_input[:100]}...")
-            gpt_response = self.openai_client.chat(full_prompt)
+            gpt_response = self._stream_response(
+                self.openai_client.chat_stream(
+                    messages=messages,
+                    prompt_cache_key=self.prompt_cache_key
+                )
+            )
             
             # Add assistant response to conversation history
-            self.conversation_history.append({
+            self.recent_messages.append({
                 "role": "assistant",
                 "content": gpt_response
             })
+            self.assistant_message_count += 1
             
             logger.info(f"GPT response: {gpt_response[:100]}...")
             return gpt_response
@@ -270,31 +479,132 @@ class SpotifyAgentCLI:
         except Exception as e:
             error_msg = f"Sorry, I encountered an error: {str(e)}"
             logger.error(f"Error processing message: {e}")
+            self.display_response(error_msg)
             return error_msg
     
-    def _build_context_prompt(self, current_input: str) -> str:
-        """Build context-aware prompt with conversation history"""
-        # Get recent conversation context (last 6 messages to avoid token limits)
-        recent_history = self.conversation_history[-6:] if len(self.conversation_history) > 6 else self.conversation_history
+    def _conversation_messages(self) -> List[Dict[str, str]]:
+        """
+        Build the message list sent to OpenAI
         
-        context_parts = []
+        Returns:
+            List[Dict[str, str]]: Context prefix, the summary of compacted
+                turns (if any) and the recent turns
+        """
+        summary = self._render_summary()
+        summary_messages = [{
+            "role": "system",
+            "content": f"Summary of earlier conversation: {summary}"
+        }] if summary else []
+        return self.context_messages + summary_messages + list(self.recent_messages)
+    
+    def _maybe_compact(self):
+        """
+        Fold older turns into the conversation summary once the estimated
+        conversation size passes COMPACTION_THRESHOLD of the context window
+        
+        There is a single summary message, updated in place by each
+        compaction, so it is the only point where the request prefix changes.
+        The summary is bounded and not part of the estimate, so compaction
+        only runs again once the recent turns themselves have grown.
+        """
+        messages = self.context_messages + list(self.recent_messages)
+        
+        # Rough estimate of 4 characters per token; leave room for the reply
+        estimated_tokens = sum(len(msg['content']) for msg in messages) // 4
+        budget = self.openai_client.context_window - self.openai_client.max_tokens
+        if estimated_tokens <= COMPACTION_THRESHOLD * budget:
+            return
+        
+        older_count = len(self.recent_messages) - MESSAGES_KEPT_VERBATIM
+        if older_count <= 0:
+            return
         
-        # Add conversation context
-        if recent_history:
-            context_parts.append("Previous conversation:")
-            for msg in recent_history:
-                if msg['role'] == 'user':
-                    context_parts.append(f"User: {msg['content']}")
-                elif msg['role'] == 'assistant':
-                    context_parts.append(f"Assistant: {msg['content'][:200]}...")  # Truncate long responses
-                elif msg['role'] == 'system':
-                    context_parts.append(f"System: {msg['content']}")
-                # Skip system messages in context to save tokens
+        compacted = [self.recent_messages.popleft() for _ in range(older_count)]
+        self._summarize_messages(compacted)
         
-        # Add current input
-        context_parts.append(f"Current request: {current_input}")
+        logger.info(f"Compacted {older_count} messages (~{estimated_tokens} tokens in conversation)")
+    
+    def _summarize_messages(self, messages: List[Dict[str, str]]):
+        """
+        Add the user's requests and the songs recommended in compacted
+        messages to the running conversation summary
+        
+        Only the latest SUMMARY_MAX_REQUESTS requests and
+        SUMMARY_MAX_RECOMMENDED songs are kept.
+        
+        Args:
+            messages (List[Dict[str, str]]): Messages being compacted
+        """
+        for msg in messages:
+            if msg['role'] == 'user':
+                self.summary_requests.append(msg['content'][:100])
+                continue
+            
+            for track, artist in self._MENTION_PATTERN.findall(msg['content']):
+                mention = f"{track.strip()} by {artist.strip()}"
+                # Move repeated songs to the end so the oldest are dropped first
+                self.summary_recommended.pop(mention, None)
+                self.summary_recommended[mention] = None
         
-        return "\n".join(context_parts)
+        while len(self.summary_recommended) > SUMMARY_MAX_RECOMMENDED:
+            del self.summary_recommended[next(iter(self.summary_recommended))]
+    
+    def _render_summary(self) -> str:
+        """
+        Format the running summary of compacted turns
+        
+        Returns:
+            str: Summary of the user's requests and the songs already recommended
+        """
+        summary_parts = []
+        if self.summary_requests:
+            summary_parts.append(f"User asked for: {'; '.join(self.summary_requests)}")
+        if self.summary_recommended:
+            summary_parts.append(f"Already recommended: {', '.join(self.summary_recommended)}")
+        
+        return ". ".join(summary_parts)
+    
+    def _stream_response(self, tokens: Iterator[str]) -> str:
+        """
+        Print response tokens as they arrive and collect the full response
+        
+        Args:
+            tokens (Iterator[str]): Response text deltas from OpenAI
+            
+        Returns:
+            str: The complete response text
+        """
+        print("\n🎯 AI Assistant: ", end="", flush=True)
+        
+        chunks = []
+        for token in tokens:
+            sys.stdout.write(token)
+            sys.stdout.flush()
+            chunks.append(token)
+            
+            # Start track searches for each completed line so the playlist
+            # is mostly resolved by the time the user accepts it
+            if self.spotify_client and '\n' in token:
+                self._prefetch_track_searches("".join(chunks))
+        
+        print("\n")
+        print("-" * 50)
+        return "".join(chunks).strip()
+    
+    def _prefetch_track_searches(self, partial_response: str):
+        """
+        Start Spotify searches for tracks in the completed lines of a partial response
+        
+        Args:
+            partial_response (str): Response text received so far
+        """
+        try:
+            complete_lines = partial_response[:partial_response.rfind('\n')]
+            self.spotify_client.prefetch_tracks_from_text(
+                complete_lines, self.search_executor, self.pending_searches
+            )
+        except Exception as e:
+            logger.error(f"Error prefetching track searches: {e}")
     
     def display_response(self, response: str):
         """Display GPT response with formatting"""
@@ -311,41 +621,25 @@ class SpotifyAgentCLI:
         Returns:
             bool: True if response contains song recommendations
         """
-        import re
-        
-        # Keywords that suggest music recommendations
-        recommendation_indicators = [
-            'song', 'track', 'music', 'artist', 'album', 'recommend', 
-            'suggest', 'playlist', 'listen', 'by ', 'ft.', 'feat.'
-        ]
-        
-        # Patterns that suggest a list of songs - updated to handle more formats
-        list_patterns = [
-            r'\d+\.\s*["\'""].*["\'""].*by\s+',     # 1. "Song" by Artist
-            r'\d+\.\s*.*\s*-\s*.*',                 # 1. Song - Artist
-            r'•\s*.*by\s+.*',                        # • Song by Artist
-            r'\*\*.*by\s+.*\*\*',                   # **Song by Artist**
-            r'\d+\.\s*Song:\s*["\'""].*["\'""]',    # 1. Song: "Title"
-            r'\d+\.\s*Song:\s*.*\n.*Artist:\s*.*',  # Multi-line Song:/Artist: format
-            r'Song:\s*["\'""].*["\'""].*Artist:',   # Song: "Title" Artist: Name
-            r'\d+\.\s*["\'""].*["\'""].*\n.*Artist:', # 1. "Song"\n   Artist: Name
-        ]
+        # Check for list patterns first - most conversational replies have no
+        # list at all, so this rejects them before the keyword scan
+        has_list = (
+            any(pattern.search(response) for pattern in self._LIST_PATTERNS)
+            or self._SONG_ARTIST_PATTERN.search(response) is not None
+        )
+        if not has_list:
+            return False
         
+        # Require at least two recommendation indicators, stopping at the second
         response_lower = response.lower()
+        indicator_count = 0
+        for indicator in self._REC_INDICATORS:
+            if indicator in response_lower:
+                indicator_count += 1
+                if indicator_count >= 2:
+                    return True
         
-        # Check for recommendation indicators
-        indicator_count = sum(1 for indicator in recommendation_indicators if indicator in response_lower)
-        
-        # Check for list patterns
-        pattern_matches = any(re.search(pattern, response, re.IGNORECASE | re.MULTILINE) for pattern in list_patterns)
-        
-        # Also check for the specific format we see in GPT responses
-        # Look for numbered lists containing both "Song:" and "Artist:" 
-        song_artist_pattern = r'\d+\.\s*Song:.*Artist:'
-        has_song_artist_format = bool(re.search(song_artist_pattern, response, re.IGNORECASE | re.MULTILINE | re.DOTALL))
-        
-        # Return true if we have indicators AND (pattern matches OR song/artist format)
-        return indicator_count >= 2 and (pattern_matches or has_song_artist_format)
+        return False
     
     def _offer_playlist_creation(self, gpt_response: str):
         """
@@ -364,7 +658,9 @@ class SpotifyAgentCLI:
                 print("\n🎵 Creating your playlist...")
                 
                 # Create playlist using Spotify client
-                result = self.spotify_client.create_recommendation_playlist_from_text(gpt_response)
+                result = self.spotify_client.create_recommendation_playlist_from_text(
+                    gpt_response, prefetched=self.pending_searches
+                )
                 
                 if result['success']:
                     print(f"\n✅ Playlist created: '{result['playlist_name']}' with {result['tracks_added']} tracks!")
@@ -400,19 +696,15 @@ class SpotifyAgentCLI:
         Returns:
             bool: True if response is affirmative
         """
-        affirmative_words = [
-            'yes', 'yeah', 'yep', 'sure', 'ok', 'okay', 'please', 'go ahead', 
-            'do it', 'create', 'make', 'add', 'absolutely', 'definitely', 'of course'
-        ]
-        
         response_lower = response.lower().strip()
         
-        # Direct matches
-        if response_lower in affirmative_words:
+        # Whole-word matches, so "book" does not count as "ok"
+        tokens = set(self._WORD_PATTERN.findall(response_lower))
+        if not tokens.isdisjoint(self._AFFIRMATIVE_WORDS):
             return True
-            
-        # Partial matches
-        return any(word in response_lower for word in affirmative_words)
+        
+        # Phrase matches
+        return any(phrase in response_lower for phrase in self._AFFIRMATIVE_PHRASES)
     
     def run_chat_loop(self):
         """Main chat loop"""
@@ -432,13 +724,10 @@ class SpotifyAgentCLI:
                 if not self.validate_input(user_input):
                     continue
                 
-                # Process message and get response
+                # Process message and stream the response
                 print("\n🤔 Thinking...")
                 response = self.process_user_message(user_input)
                 
-                # Display response
-                self.display_response(response)
-                
                 # Check if this looks like a music recommendation and offer playlist creation
                 if self._contains_music_recommendations(response) and self.spotify_client:
                     self._offer_playlist_creation(response)
@@ -473,6 +762,7 @@ class SpotifyAgentCLI:
             print(f"\n❌ Session error: {e}")
             logger.error(f"Session error: {e}")
         finally:
+            self.search_executor.shutdown(wait=False)
             logger.info("=== CHAT SESSION ENDED ===")
 
 
@@ -6,14 +6,177 @@ Handles JSON file loading, parsing, data cleaning, and normalization
 import json
 import os
 import re
+import sys
+import pickle
+import hashlib
+import threading
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Tuple, Iterator, Iterable
 from collections import defaultdict, Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
 import logging
 
+# orjson parses the export files several times faster; pysimdjson is the
+# next choice, then the stdlib parser (all accept bytes). orjson comes first
+# because every field is cleaned, so the files are fully converted to Python
+# objects and orjson builds those directly, while most of simdjson's time
+# goes into that conversion rather than its SIMD tokenizer.
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    try:
+        import simdjson
+        
+        # A simdjson parser is not thread safe and the files load concurrently,
+        # so each loader thread gets its own reusable parser
+        _simdjson_parsers = threading.local()
+        
+        def _json_loads(raw: bytes) -> Any:
+            parser = getattr(_simdjson_parsers, 'parser', None)
+            if parser is None:
+                parser = _simdjson_parsers.parser = simdjson.Parser()
+            return parser.parse(raw, recursive=True)
+    except ImportError:
+        _json_loads = json.loads
+
+# ijson parses a JSON array one element at a time, used for very large
+# streaming histories so the raw document is never held in memory at once
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Spotify export files read from the data folder
+STREAMING_HISTORY_FILE = "StreamingHistory_music_0.json"
+SOUND_CAPSULE_FILE = "YourSoundCapsule.json"
+LIBRARY_FILE = "YourLibrary.json"
+
+# Streaming histories at least this large are stream-parsed when ijson is available
+STREAM_PARSE_THRESHOLD = 64 * 1024 * 1024
+
+# Cleaned data is cached here, one file per source keyed on its path, mtime and size
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'spotify_agent')
+
+# Bump whenever the cleaned data format changes to invalidate old caches
+CACHE_VERSION = 2
+
+# Name normalization patterns, compiled once since they run for every record
+_ARTIST_FEAT_RE = re.compile(r'^\s*(?:featuring|feat\.?|ft\.?)\s*', re.IGNORECASE)
+_PAREN_RE = re.compile(r'\s*\([^)]*\)\s*')
+_TRAILING_PAREN_RE = re.compile(r'\s*\([^)]*\)\s*$')
+_TRACK_REMIX_RE = re.compile(r'\s*-\s*(?:Re)?Mix\s*$', re.IGNORECASE)
+_TRACK_MIX_PAREN_RE = re.compile(r'\s*\([^)]*Mix[^)]*\)\s*', re.IGNORECASE)
+_ALBUM_SINGLE_RE = re.compile(r'\s*-\s*Single\s*$', re.IGNORECASE)
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+# Names repeat heavily across a streaming history, so each normalizer is
+# memoized on the raw name and its patterns run once per distinct string.
+# Results are interned, so raw variants that normalize to the same name
+# share one string object across all records
+@lru_cache(maxsize=200_000)
+def _normalize_artist_name(name: str) -> str:
+    """
+    Normalize artist name by removing common artifacts
+
+    Args:
+        name: Raw artist name
+
+    Returns:
+        Normalized artist name
+    """
+    if not name:
+        return ""
+
+    # Remove a leading feat./ft./featuring
+    name = _ARTIST_FEAT_RE.sub('', name)
+
+    # Remove parentheses content
+    name = _PAREN_RE.sub(' ', name)
+
+    # Remove extra whitespace
+    name = _WHITESPACE_RE.sub(' ', name).strip()
+
+    return sys.intern(name)
+
+
+@lru_cache(maxsize=200_000)
+def _normalize_track_name(name: str) -> str:
+    """
+    Normalize track name by removing common artifacts
+
+    Args:
+        name: Raw track name
+
+    Returns:
+        Normalized track name
+    """
+    if not name:
+        return ""
+
+    # Remove common suffixes
+    name = _TRAILING_PAREN_RE.sub('', name)  # Remove trailing parentheses
+    name = _TRACK_REMIX_RE.sub('', name)
+    name = _TRACK_MIX_PAREN_RE.sub('', name)
+
+    # Remove extra whitespace
+    name = _WHITESPACE_RE.sub(' ', name).strip()
+
+    return sys.intern(name)
+
+
+@lru_cache(maxsize=200_000)
+def _normalize_album_name(name: str) -> str:
+    """
+    Normalize album name by removing common artifacts
+
+    Args:
+        name: Raw album name
+
+    Returns:
+        Normalized album name
+    """
+    if not name:
+        return ""
+
+    # Remove common suffixes
+    name = _ALBUM_SINGLE_RE.sub('', name)
+    name = _TRAILING_PAREN_RE.sub('', name)  # Remove trailing parentheses
+
+    # Remove extra whitespace
+    name = _WHITESPACE_RE.sub(' ', name).strip()
+
+    return sys.intern(name)
+
+
+def _parse_end_time(end_time: str) -> datetime:
+    """
+    Parse a streaming history endTime ("YYYY-MM-DD HH:MM")
+    
+    The exports always use this fixed-width layout, so the fields are sliced
+    out directly; anything else goes through strptime.
+    
+    Args:
+        end_time: Raw endTime value
+        
+    Returns:
+        Parsed timestamp
+        
+    Raises:
+        ValueError: If the value is not a valid timestamp
+    """
+    if (len(end_time) == 16 and end_time[4] == '-' and end_time[7] == '-'
+            and end_time[10] == ' ' and end_time[13] == ':'):
+        return datetime(int(end_time[0:4]), int(end_time[5:7]), int(end_time[8:10]),
+                        int(end_time[11:13]), int(end_time[14:16]))
+    return datetime.strptime(end_time, "%Y-%m-%d %H:%M")
+
 
 class DataProcessor:
     """
@@ -28,10 +191,62 @@ class DataProcessor:
             data_folder: Path to the folder containing JSON data files
         """
         self.data_folder = data_folder
-        self.streaming_history = []
-        self.sound_capsule = {}
-        self.library = {}
+        # Each source is parsed on first access (see the properties below)
+        self._streaming_history = None
+        self._sound_capsule = None
+        self._library = None
         self.processed_data = {}
+        # Year -> (artist names, track names) of its plays, and "YYYY" -> monthly
+        # sound capsule stats, built on the first year chunk request
+        self._by_year = None
+        self._capsule_by_year = None
+    
+    @property
+    def streaming_history(self) -> List[Dict[str, Any]]:
+        """Cleaned streaming history records, loaded on first access"""
+        if self._streaming_history is None:
+            try:
+                self._streaming_history = self._load_cached(STREAMING_HISTORY_FILE, self._load_streaming_history)
+            except Exception:
+                # Already logged; the failed load is not written to the cache
+                self._streaming_history = []
+        return self._streaming_history
+    
+    @streaming_history.setter
+    def streaming_history(self, records: List[Dict[str, Any]]) -> None:
+        self._streaming_history = records
+        self._by_year = None
+    
+    @property
+    def sound_capsule(self) -> Dict[str, Any]:
+        """Cleaned sound capsule data, loaded on first access"""
+        if self._sound_capsule is None:
+            try:
+                self._sound_capsule = self._load_cached(SOUND_CAPSULE_FILE, self._load_sound_capsule)
+            except Exception:
+                # Already logged; the failed load is not written to the cache
+                self._sound_capsule = {}
+        return self._sound_capsule
+    
+    @sound_capsule.setter
+    def sound_capsule(self, data: Dict[str, Any]) -> None:
+        self._sound_capsule = data
+        self._capsule_by_year = None
+    
+    @property
+    def library(self) -> Dict[str, Any]:
+        """Cleaned library data, loaded on first access"""
+        if self._library is None:
+            try:
+                self._library = self._load_cached(LIBRARY_FILE, self._load_library)
+            except Exception:
+                # Already logged; the failed load is not written to the cache
+                self._library = {}
+        return self._library
+    
+    @library.setter
+    def library(self, data: Dict[str, Any]) -> None:
+        self._library = data
     
     def load_all_data(self) -> Dict[str, Any]:
         """
@@ -43,29 +258,123 @@ class DataProcessor:
         logger.info("Loading all JSON data files...")
         
         try:
-            # Load streaming history
-            self.streaming_history = self._load_streaming_history()
-            logger.info(f"Loaded {len(self.streaming_history)} streaming history records")
-            
-            # Load sound capsule
-            self.sound_capsule = self._load_sound_capsule()
-            logger.info(f"Loaded sound capsule with {len(self.sound_capsule.get('stats', []))} monthly stats")
-            
-            # Load library
-            self.library = self._load_library()
-            logger.info(f"Loaded library with {len(self.library.get('tracks', []))} tracks and {len(self.library.get('albums', []))} albums")
+            # The three files are independent, so read and parse them concurrently
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                history_future = executor.submit(lambda: self.streaming_history)
+                capsule_future = executor.submit(lambda: self.sound_capsule)
+                library_future = executor.submit(lambda: self.library)
+                
+                # Load streaming history
+                streaming_history = history_future.result()
+                logger.info(f"Loaded {len(streaming_history)} streaming history records")
+                
+                # Load sound capsule
+                sound_capsule = capsule_future.result()
+                logger.info(f"Loaded sound capsule with {len(sound_capsule.get('stats', []))} monthly stats")
+                
+                # Load library
+                library = library_future.result()
+                logger.info(f"Loaded library with {len(library.get('tracks', []))} tracks and {len(library.get('albums', []))} albums")
             
             logger.info("All data loaded successfully")
             return {
-                'streaming_history': self.streaming_history,
-                'sound_capsule': self.sound_capsule,
-                'library': self.library
+                'streaming_history': streaming_history,
+                'sound_capsule': sound_capsule,
+                'library': library
             }
             
         except Exception as e:
             logger.error(f"Error loading data: {e}")
             raise
     
+    def _load_cached(self, file_name: str, loader, variant: Optional[str] = None) -> Any:
+        """
+        Load one data file through the pickle cache
+        
+        Args:
+            file_name: Name of the data file in the data folder
+            loader: Method that reads and cleans the file
+            variant: Name distinguishing other data derived from the same file
+            
+        Returns:
+            Cleaned data, from the cache if the file is unchanged since it was written
+        """
+        cache_path = self._cache_path(file_name, variant)
+        if cache_path is None:
+            # Missing file: the loader logs it and returns empty data
+            return loader()
+        
+        cached = self._read_cache(cache_path)
+        if cached is not None:
+            logger.info(f"Loaded {file_name} from cache")
+            return cached
+        
+        data = loader()
+        self._write_cache(cache_path, data)
+        return data
+    
+    def _cache_path(self, file_name: str, variant: Optional[str] = None) -> Optional[str]:
+        """
+        Build the cache file path for the current state of a data file
+        
+        Args:
+            file_name: Name of the data file in the data folder
+            variant: Name distinguishing other data derived from the same file
+            
+        Returns:
+            Path of the pickle cache, unique to the file's path, mtime and size,
+            or None if the file does not exist
+        """
+        file_path = os.path.abspath(os.path.join(self.data_folder, file_name))
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+        
+        key = (CACHE_VERSION, file_path, stat.st_mtime_ns, stat.st_size)
+        digest = hashlib.sha256(repr(key).encode('utf-8')).hexdigest()[:16]
+        stem = os.path.splitext(file_name)[0]
+        if variant:
+            stem = f"{stem}_{variant}"
+        return os.path.join(CACHE_DIR, f"{stem}_{digest}.pkl")
+    
+    def _read_cache(self, cache_path: str) -> Any:
+        """
+        Load cleaned data from the pickle cache
+        
+        Args:
+            cache_path: Path of the pickle cache
+            
+        Returns:
+            Cached data, or None if there is no usable cache
+        """
+        try:
+            with open(cache_path, 'rb') as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable data cache {cache_path}: {e}")
+            return None
+    
+    def _write_cache(self, cache_path: str, data: Any) -> None:
+        """
+        Save cleaned data to the pickle cache
+        
+        Args:
+            cache_path: Path of the pickle cache
+            data: Cleaned data
+        """
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            # Write to a temporary file first so a partial cache is never read
+            tmp_path = f"{cache_path}.tmp"
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            logger.warning(f"Could not write data cache {cache_path}: {e}")
+    
     def load_2024_chunk(self, limit: int = 30) -> Dict[str, str]:
         """
         Load and format 2024 listening data for GPT processing.
@@ -77,80 +386,145 @@ class DataProcessor:
         Returns:
             Dictionary with formatted strings for recent tracks, top artists, and genres
         """
-        logger.info("Loading 2024 chunk for GPT processing...")
+        return self.load_year_chunk(2024, limit)
+    
+    def load_year_chunk(self, year: int, limit: int = 30) -> Dict[str, str]:
+        """
+        Load and format one year of listening data for GPT processing.
+        Only includes essential data: track names, artist names, and genres.
+        
+        Args:
+            year: Calendar year to extract
+            limit: Maximum number of items to include per category
+            
+        Returns:
+            Dictionary with formatted strings for recent tracks, top artists, and genres
+        """
+        logger.info(f"Loading {year} chunk for GPT processing...")
         
         try:
-            # Get 2024 data
-            data_2024 = self._get_2024_essential_data()
+            # Get the year's data
+            year_data = self._get_year_essential_data(year)
             
             # Format each component
             formatted_data = {
-                'recent_tracks': self._format_2024_tracks_simple(data_2024['tracks'], limit),
-                'top_artists': self._format_2024_artists_simple(data_2024['artists'], limit),
-                'top_genres': self._format_2024_genres_simple(data_2024['genres'], limit)
+                'recent_tracks': self._format_csv(year_data['tracks'], limit),
+                'top_artists': self._format_csv(year_data['artists'], limit),
+                'top_genres': self._format_csv(year_data['genres'], limit)
             }
             
             return formatted_data
             
         except Exception as e:
-            logger.error(f"Error loading 2024 chunk: {e}")
+            logger.error(f"Error loading {year} chunk: {e}")
             return {'recent_tracks': '', 'top_artists': '', 'top_genres': ''}
     
     def _get_2024_essential_data(self) -> Dict[str, List[str]]:
         """
         Extract essential 2024 data from all sources
         """
-        data_2024 = {
+        return self._get_year_essential_data(2024)
+    
+    def _get_year_essential_data(self, year: int) -> Dict[str, List[str]]:
+        """
+        Extract essential data for one year from all sources
+        
+        Args:
+            year: Calendar year to extract
+            
+        Returns:
+            Dictionary of unique tracks, artists and genres in first-seen order
+        """
+        year_data = {
             'tracks': [],
             'artists': [],
             'genres': []
         }
         
-        # Get tracks and artists from streaming history
-        if self.streaming_history:
-            logger.info(f"Processing {len(self.streaming_history)} streaming history records")
-            records_2024 = 0
-            for record in self.streaming_history:
-                if record['timestamp'].year == 2024:
-                    records_2024 += 1
-                    track_str = f"{record['trackName']} by {record['artistName']}"
-                    if track_str not in data_2024['tracks']:
-                        data_2024['tracks'].append(track_str)
-                    if record['artistName'] not in data_2024['artists']:
-                        data_2024['artists'].append(record['artistName'])
-            logger.info(f"Found {records_2024} records from 2024")
-        
-        # Get genres from sound capsule
-        if self.sound_capsule.get('stats'):
-            logger.info(f"Processing {len(self.sound_capsule['stats'])} monthly stats")
-            months_2024 = 0
-            for stat in self.sound_capsule['stats']:
-                # Assuming date format is YYYY-MM
-                if stat.get('date', '').startswith('2024'):
-                    months_2024 += 1
-                    for genre in stat.get('topGenres', []):
-                        genre_name = genre['name']
-                        if genre_name not in data_2024['genres']:
-                            data_2024['genres'].append(genre_name)
-            logger.info(f"Found {months_2024} months from 2024")
-        
-        logger.info(f"Extracted {len(data_2024['tracks'])} unique tracks, {len(data_2024['artists'])} unique artists, and {len(data_2024['genres'])} unique genres from 2024")
-        return data_2024
-    
-    def _format_2024_tracks_simple(self, tracks: List[str], limit: int) -> str:
-        """Format tracks as comma-separated string"""
-        top_tracks = tracks[:limit] if limit > 0 else tracks
-        return ", ".join(top_tracks)
-    
-    def _format_2024_artists_simple(self, artists: List[str], limit: int) -> str:
-        """Format artists as comma-separated string"""
-        top_artists = artists[:limit] if limit > 0 else artists
-        return ", ".join(top_artists)
-    
-    def _format_2024_genres_simple(self, genres: List[str], limit: int) -> str:
-        """Format genres as comma-separated string"""
-        top_genres = genres[:limit] if limit > 0 else genres
-        return ", ".join(top_genres)
+        # Group the streaming history and sound capsule by year on first use;
+        # this only loads those two sources, never the library
+        if self._by_year is None or self._capsule_by_year is None:
+            self._index_by_year()
+        
+        # Sets for O(1) duplicate checks; the lists keep first-seen order
+        tracks_seen = set()
+        artists_seen = set()
+        genres_seen = set()
+        
+        # Get tracks and artists from the year's streaming history columns
+        artist_names, track_names = self._by_year.get(year, ([], []))
+        if artist_names:
+            logger.info(f"Processing {len(artist_names)} streaming history records from {year}")
+            for artist_name, track_name in zip(artist_names, track_names):
+                # Key on the name pair and only format the first occurrence
+                track_key = (artist_name, track_name)
+                if track_key not in tracks_seen:
+                    tracks_seen.add(track_key)
+                    year_data['tracks'].append(f"{track_name} by {artist_name}")
+                if artist_name not in artists_seen:
+                    artists_seen.add(artist_name)
+                    year_data['artists'].append(artist_name)
+        
+        # Get genres from the year's sound capsule stats
+        stats = self._capsule_by_year.get(str(year), [])
+        if stats:
+            logger.info(f"Found {len(stats)} months from {year}")
+            for stat in stats:
+                for genre in stat.get('topGenres', []):
+                    genre_name = genre['name']
+                    if genre_name not in genres_seen:
+                        genres_seen.add(genre_name)
+                        year_data['genres'].append(genre_name)
+        
+        logger.info(f"Extracted {len(year_data['tracks'])} unique tracks, {len(year_data['artists'])} unique artists, and {len(year_data['genres'])} unique genres from {year}")
+        return year_data
+    
+    def _index_by_year(self) -> None:
+        """
+        Group streaming history by year into parallel artist and track name
+        lists, so a year's chunk only visits that year's plays and reads two
+        flat lists instead of a dict per record. Sound capsule stats are
+        grouped by year the same way.
+        """
+        if self._streaming_history is not None:
+            self._by_year = self._build_year_columns(self._streaming_history)
+        else:
+            # Nothing needs the full record list yet, so build the index in
+            # one pass over the cleaned records without keeping them, and
+            # cache the (much smaller) index on its own
+            self._by_year = self._load_cached(
+                STREAMING_HISTORY_FILE,
+                lambda: self._build_year_columns(self._iter_cleaned_streaming_records()),
+                variant='by_year'
+            )
+        
+        # Monthly sound capsule stats grouped by the year of their YYYY-MM date
+        self._capsule_by_year = defaultdict(list)
+        for stat in self.sound_capsule.get('stats', []):
+            self._capsule_by_year[stat['date'][:4]].append(stat)
+    
+    @staticmethod
+    def _build_year_columns(records: Iterable[Dict[str, Any]]) -> Dict[int, Tuple[List[str], List[str]]]:
+        """
+        Group streaming history records into per-year artist and track name columns
+        
+        Args:
+            records: Cleaned streaming history records
+            
+        Returns:
+            Dictionary mapping each year to (artist names, track names) of its plays
+        """
+        by_year = defaultdict(lambda: ([], []))
+        for record in records:
+            artist_names, track_names = by_year[record['timestamp'].year]
+            artist_names.append(record['artistName'])
+            track_names.append(record['trackName'])
+        return dict(by_year)
+    
+    @staticmethod
+    def _format_csv(items: List[str], limit: int) -> str:
+        """Format the first limit items (all if limit <= 0) as a comma-separated string"""
+        return ", ".join(islice(items, limit) if limit > 0 else items)
     
     def _load_streaming_history(self) -> List[Dict[str, Any]]:
         """
@@ -159,28 +533,40 @@ class DataProcessor:
         Returns:
             List of streaming history records
         """
-        file_path = os.path.join(self.data_folder, "StreamingHistory_music_0.json")
+        return list(self._iter_cleaned_streaming_records())
+    
+    def _iter_cleaned_streaming_records(self) -> Iterator[Dict[str, Any]]:
+        """
+        Read the streaming history file and yield each valid cleaned record
         
-        if not os.path.exists(file_path):
-            logger.warning(f"Streaming history file not found: {file_path}")
-            return []
+        Yields:
+            Cleaned streaming history records in file order
+            
+        Raises:
+            Exception: If the file cannot be parsed, possibly after some
+                records were yielded, so a partial history is never cached
+        """
+        file_path = os.path.join(self.data_folder, STREAMING_HISTORY_FILE)
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            # Clean and validate each record
-            cleaned_data = []
-            for record in data:
-                cleaned_record = self._clean_streaming_record(record)
-                if cleaned_record:
-                    cleaned_data.append(cleaned_record)
-            
-            return cleaned_data
-            
+            with open(file_path, 'rb') as f:
+                if ijson is not None and os.fstat(f.fileno()).st_size >= STREAM_PARSE_THRESHOLD:
+                    # Parse one record at a time instead of the whole array
+                    data = ijson.items(f, 'item', use_float=True)
+                else:
+                    data = _json_loads(f.read())
+                
+                # Clean and validate each record
+                for record in data:
+                    cleaned_record = self._clean_streaming_record(record)
+                    if cleaned_record is not None:
+                        yield cleaned_record
+            
+        except FileNotFoundError:
+            logger.warning(f"Streaming history file not found: {file_path}")
         except Exception as e:
             logger.error(f"Error loading streaming history: {e}")
-            return []
+            raise
     
     def _load_sound_capsule(self) -> Dict[str, Any]:
         """
@@ -188,23 +574,26 @@ class DataProcessor:
         
         Returns:
             Sound capsule data dictionary
+            
+        Raises:
+            Exception: If the file cannot be read or parsed, so the failure
+                is never cached
         """
-        file_path = os.path.join(self.data_folder, "YourSoundCapsule.json")
-        
-        if not os.path.exists(file_path):
-            logger.warning(f"Sound capsule file not found: {file_path}")
-            return {}
+        file_path = os.path.join(self.data_folder, SOUND_CAPSULE_FILE)
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(file_path, 'rb') as f:
+                data = _json_loads(f.read())
             
             # Clean and validate the data
             return self._clean_sound_capsule(data)
             
+        except FileNotFoundError:
+            logger.warning(f"Sound capsule file not found: {file_path}")
+            return {}
         except Exception as e:
             logger.error(f"Error loading sound capsule: {e}")
-            return {}
+            raise
     
     def _load_library(self) -> Dict[str, Any]:
         """
@@ -212,23 +601,26 @@ class DataProcessor:
         
         Returns:
             Library data dictionary
+            
+        Raises:
+            Exception: If the file cannot be read or parsed, so the failure
+                is never cached
         """
-        file_path = os.path.join(self.data_folder, "YourLibrary.json")
-        
-        if not os.path.exists(file_path):
-            logger.warning(f"Library file not found: {file_path}")
-            return {}
+        file_path = os.path.join(self.data_folder, LIBRARY_FILE)
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(file_path, 'rb') as f:
+                data = _json_loads(f.read())
             
             # Clean and validate the data
             return self._clean_library(data)
             
+        except FileNotFoundError:
+            logger.warning(f"Library file not found: {file_path}")
+            return {}
         except Exception as e:
             logger.error(f"Error loading library: {e}")
-            return {}
+            raise
     
     def _clean_streaming_record(self, record: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
@@ -240,44 +632,52 @@ class DataProcessor:
         Returns:
             Cleaned record or None if invalid
         """
+        # Extract and validate required fields up front, so malformed values
+        # are rejected without an exception handler around the whole record
+        if not isinstance(record, dict):
+            return None
+        
+        end_time = record.get('endTime')
+        artist_name = record.get('artistName')
+        track_name = record.get('trackName')
+        ms_played = record.get('msPlayed', 0)
+        
+        if (not isinstance(end_time, str) or not isinstance(artist_name, str)
+                or not isinstance(track_name, str) or not isinstance(ms_played, (int, float))):
+            return None
+        
+        artist_name = artist_name.strip()
+        track_name = track_name.strip()
+        
+        # Skip records with missing essential data
+        if not end_time or not artist_name or not track_name:
+            return None
+        
+        # Parse and validate timestamp
         try:
-            # Extract and validate required fields
-            end_time = record.get('endTime')
-            artist_name = record.get('artistName', '').strip()
-            track_name = record.get('trackName', '').strip()
-            ms_played = record.get('msPlayed', 0)
-            
-            # Skip records with missing essential data
-            if not end_time or not artist_name or not track_name:
-                return None
-            
-            # Parse and validate timestamp
-            try:
-                timestamp = datetime.strptime(end_time, "%Y-%m-%d %H:%M")
-            except ValueError:
-                logger.warning(f"Invalid timestamp format: {end_time}")
-                return None
-            
-            # Clean artist and track names
-            artist_name = self._normalize_artist_name(artist_name)
-            track_name = self._normalize_track_name(track_name)
-            
-            # Skip if names are too short after cleaning
-            if len(artist_name) < 1 or len(track_name) < 1:
-                return None
-            
-            return {
-                'endTime': end_time,
-                'timestamp': timestamp,
-                'artistName': artist_name,
-                'trackName': track_name,
-                'msPlayed': ms_played,
-                'secondsPlayed': ms_played / 1000 if ms_played > 0 else 0
-            }
-            
-        except Exception as e:
-            logger.warning(f"Error cleaning streaming record: {e}")
+            timestamp = _parse_end_time(end_time)
+        except ValueError:
+            logger.warning(f"Invalid timestamp format: {end_time}")
             return None
+        
+        # Clean artist and track names. The memoized module functions are
+        # called directly: repeats are a single C-level cache lookup, without
+        # going through the delegating methods
+        artist_name = _normalize_artist_name(artist_name)
+        track_name = _normalize_track_name(track_name)
+        
+        # Skip if names are too short after cleaning
+        if len(artist_name) < 1 or len(track_name) < 1:
+            return None
+        
+        return {
+            'endTime': end_time,
+            'timestamp': timestamp,
+            'artistName': artist_name,
+            'trackName': track_name,
+            'msPlayed': ms_played,
+            'secondsPlayed': ms_played / 1000 if ms_played > 0 else 0
+        }
     
     def _clean_sound_capsule(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -289,18 +689,15 @@ class DataProcessor:
         Returns:
             Cleaned sound capsule data
         """
-        cleaned_data = {
-            'stats': [],
+        # Clean monthly stats
+        return {
+            'stats': [
+                cleaned_stat for cleaned_stat in
+                (self._clean_monthly_stat(stat) for stat in data.get('stats', []))
+                if cleaned_stat is not None
+            ],
             'highlights': data.get('highlights', [])
         }
-        
-        # Clean monthly stats
-        for stat in data.get('stats', []):
-            cleaned_stat = self._clean_monthly_stat(stat)
-            if cleaned_stat:
-                cleaned_data['stats'].append(cleaned_stat)
-        
-        return cleaned_data
     
     def _clean_monthly_stat(self, stat: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
@@ -318,36 +715,29 @@ class DataProcessor:
             if not date:
                 return None
             
-            cleaned_stat = {
+            # Clean top tracks, artists and genres, dropping invalid entries
+            return {
                 'date': date,
                 'streamCount': stat.get('streamCount', 0),
                 'secondsPlayed': stat.get('secondsPlayed', 0),
-                'topTracks': [],
-                'topArtists': [],
-                'topGenres': [],
+                'topTracks': [
+                    cleaned_track for cleaned_track in
+                    (self._clean_top_track(track) for track in stat.get('topTracks', []))
+                    if cleaned_track is not None
+                ],
+                'topArtists': [
+                    cleaned_artist for cleaned_artist in
+                    (self._clean_top_artist(artist) for artist in stat.get('topArtists', []))
+                    if cleaned_artist is not None
+                ],
+                'topGenres': [
+                    cleaned_genre for cleaned_genre in
+                    (self._clean_top_genre(genre) for genre in stat.get('topGenres', []))
+                    if cleaned_genre is not None
+                ],
                 'timeOfDayStats': stat.get('timeOfDayStats', [])
             }
             
-            # Clean top tracks
-            for track in stat.get('topTracks', []):
-                cleaned_track = self._clean_top_track(track)
-                if cleaned_track:
-                    cleaned_stat['topTracks'].append(cleaned_track)
-            
-            # Clean top artists
-            for artist in stat.get('topArtists', []):
-                cleaned_artist = self._clean_top_artist(artist)
-                if cleaned_artist:
-                    cleaned_stat['topArtists'].append(cleaned_artist)
-            
-            # Clean top genres
-            for genre in stat.get('topGenres', []):
-                cleaned_genre = self._clean_top_genre(genre)
-                if cleaned_genre:
-                    cleaned_stat['topGenres'].append(cleaned_genre)
-            
-            return cleaned_stat
-            
         except Exception as e:
             logger.warning(f"Error cleaning monthly stat: {e}")
             return None
@@ -415,8 +805,10 @@ class DataProcessor:
             if not name:
                 return None
             
+            # Genres repeat every month; interning makes the copies one
+            # object, so dedup comparisons short-circuit on identity
             return {
-                'name': name,
+                'name': sys.intern(name),
                 'streamCount': genre.get('streamCount', 0),
                 'secondsPlayed': genre.get('secondsPlayed', 0)
             }
@@ -434,26 +826,21 @@ class DataProcessor:
         Returns:
             Cleaned library data
         """
-        cleaned_data = {
-            'tracks': [],
-            'albums': [],
+        # Clean tracks and albums, dropping invalid entries
+        return {
+            'tracks': [
+                cleaned_track for cleaned_track in
+                (self._clean_library_track(track) for track in data.get('tracks', []))
+                if cleaned_track is not None
+            ],
+            'albums': [
+                cleaned_album for cleaned_album in
+                (self._clean_library_album(album) for album in data.get('albums', []))
+                if cleaned_album is not None
+            ],
             'shows': data.get('shows', []),
             'episodes': data.get('episodes', [])
         }
-        
-        # Clean tracks
-        for track in data.get('tracks', []):
-            cleaned_track = self._clean_library_track(track)
-            if cleaned_track:
-                cleaned_data['tracks'].append(cleaned_track)
-        
-        # Clean albums
-        for album in data.get('albums', []):
-            cleaned_album = self._clean_library_album(album)
-            if cleaned_album:
-                cleaned_data['albums'].append(cleaned_album)
-        
-        return cleaned_data
     
     def _clean_library_track(self, track: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
@@ -512,77 +899,16 @@ class DataProcessor:
             return None
     
     def _normalize_artist_name(self, name: str) -> str:
-        """
-        Normalize artist name by removing common artifacts
-        
-        Args:
-            name: Raw artist name
-            
-        Returns:
-            Normalized artist name
-        """
-        if not name:
-            return ""
-        
-        # Remove common prefixes/suffixes
-        name = re.sub(r'^\s*feat\.?\s*', '', name, flags=re.IGNORECASE)
-        name = re.sub(r'^\s*ft\.?\s*', '', name, flags=re.IGNORECASE)
-        name = re.sub(r'^\s*featuring\s*', '', name, flags=re.IGNORECASE)
-        
-        # Remove parentheses content
-        name = re.sub(r'\s*\([^)]*\)\s*', ' ', name)
-        
-        # Remove extra whitespace
-        name = re.sub(r'\s+', ' ', name).strip()
-        
-        return name
+        """Normalize artist name, memoized across all instances"""
+        return _normalize_artist_name(name)
     
     def _normalize_track_name(self, name: str) -> str:
-        """
-        Normalize track name by removing common artifacts
-        
-        Args:
-            name: Raw track name
-            
-        Returns:
-            Normalized track name
-        """
-        if not name:
-            return ""
-        
-        # Remove common suffixes
-        name = re.sub(r'\s*\([^)]*\)\s*$', '', name)  # Remove trailing parentheses
-        name = re.sub(r'\s*-\s*Remix\s*$', '', name, flags=re.IGNORECASE)
-        name = re.sub(r'\s*-\s*Mix\s*$', '', name, flags=re.IGNORECASE)
-        name = re.sub(r'\s*\([^)]*Mix[^)]*\)\s*', '', name, flags=re.IGNORECASE)
-        
-        # Remove extra whitespace
-        name = re.sub(r'\s+', ' ', name).strip()
-        
-        return name
+        """Normalize track name, memoized across all instances"""
+        return _normalize_track_name(name)
     
     def _normalize_album_name(self, name: str) -> str:
-        """
-        Normalize album name by removing common artifacts
-        
-        Args:
-            name: Raw album name
-            
-        Returns:
-            Normalized album name
-        """
-        if not name:
-            return ""
-        
-        # Remove common suffixes
-        name = re.sub(r'\s*-\s*Single\s*$', '', name, flags=re.IGNORECASE)
-        name = re.sub(r'\s*\([^)]*\)\s*$', '', name)  # Remove trailing parentheses
-        
-        # Remove extra whitespace
-        name = re.sub(r'\s+', ' ', name).strip()
-        
-        return name
-
+        """Normalize album name, memoized across all instances"""
+        return _normalize_album_name(name)
 
 # Convenience function for quick data loading
 def load_spotify_data(data_folder: str = "data") -> Dict[str, Any]:
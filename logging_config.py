@@ -4,10 +4,32 @@ Spotify Agent - Logging Configuration
 Centralized logging setup for the entire application
 """
 
+import atexit
 import logging
 import os
+import queue
 from datetime import datetime
-from logging.handlers import RotatingFileHandler
+from pathlib import Path
+from logging.handlers import RotatingFileHandler, MemoryHandler, QueueHandler, QueueListener
+
+# Background listener that writes queued log records to the real handlers
+_queue_listener = None
+
+# Number of records buffered before they are written to the log file together
+LOG_FILE_BATCH_SIZE = 50
+
+
+def _stop_queue_listener():
+    """Flush queued log records and stop the background listener"""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        for handler in _queue_listener.handlers:
+            handler.flush()
+        _queue_listener = None
+
+
+atexit.register(_stop_queue_listener)
 
 
 def setup_logging(log_level=logging.INFO):
@@ -22,13 +44,12 @@ def setup_logging(log_level=logging.INFO):
     """
     
     # Create logs directory if it doesn't exist
-    logs_dir = "logs"
-    if not os.path.exists(logs_dir):
-        os.makedirs(logs_dir)
+    logs_dir = Path("logs")
+    logs_dir.mkdir(parents=True, exist_ok=True)
     
     # Generate log file name with timestamp
     timestamp = datetime.now().strftime("%Y%m%d")
-    log_file_path = os.path.join(logs_dir, f"spotify_agent_{timestamp}.log")
+    log_file_path = str(logs_dir / f"spotify_agent_{timestamp}.log")
     
     # Create simple text formatter
     log_formatter = logging.Formatter(
@@ -41,6 +62,7 @@ def setup_logging(log_level=logging.INFO):
     root_logger.setLevel(log_level)
     
     # Clear any existing handlers
+    _stop_queue_listener()
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
     
@@ -54,6 +76,14 @@ def setup_logging(log_level=logging.INFO):
     file_handler.setLevel(log_level)
     file_handler.setFormatter(log_formatter)
     
+    # Batch file writes; warnings and errors are written out immediately
+    buffered_file_handler = MemoryHandler(
+        capacity=LOG_FILE_BATCH_SIZE,
+        flushLevel=logging.WARNING,
+        target=file_handler
+    )
+    buffered_file_handler.setLevel(log_level)
+    
     # Console handler for important messages
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.WARNING)  # Only warnings and errors to console
@@ -62,9 +92,17 @@ def setup_logging(log_level=logging.INFO):
     )
     console_handler.setFormatter(console_formatter)
     
-    # Add handlers to root logger
-    root_logger.addHandler(file_handler)
-    root_logger.addHandler(console_handler)
+    # Loggers only enqueue records; a background thread formats them and
+    # does the file and console I/O, so logging never blocks the caller
+    global _queue_listener
+    log_queue = queue.SimpleQueue()
+    _queue_listener = QueueListener(
+        log_queue, buffered_file_handler, console_handler, respect_handler_level=True
+    )
+    _queue_listener.start()
+    
+    # Add the queue handler to root logger
+    root_logger.addHandler(QueueHandler(log_queue))
     
     # Reduce verbosity of external libraries
     logging.getLogger('httpx').setLevel(logging.WARNING)
@@ -110,8 +148,10 @@ def log_function_entry(logger, func_name, **kwargs):
         func_name (str): Function name
         **kwargs: Function parameters to log
     """
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
     params = ", ".join([f"{k}={v}" for k, v in kwargs.items()]) if kwargs else "no parameters"
-    logger.debug(f"ENTERING {func_name}({params})")
+    logger.debug("ENTERING %s(%s)", func_name, params)
 
 
 def log_function_exit(logger, func_name, result=None, success=True):
@@ -124,9 +164,11 @@ def log_function_exit(logger, func_name, result=None, success=True):
         result: Function result to log
         success (bool): Whether function completed successfully
     """
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
     status = "SUCCESS" if success else "FAILED"
     result_str = f" -> {result}" if result is not None else ""
-    logger.debug(f"EXITING {func_name} [{status}]{result_str}")
+    logger.debug("EXITING %s [%s]%s", func_name, status, result_str)
 
 
 def log_api_call(logger, api_name, endpoint, method="GET", params=None, response_status=None):
@@ -141,9 +183,11 @@ def log_api_call(logger, api_name, endpoint, method="GET", params=None, response
         params: Request parameters
         response_status: Response status code
     """
+    if not logger.isEnabledFor(logging.INFO):
+        return
     params_str = f" with params: {params}" if params else ""
     status_str = f" -> Status: {response_status}" if response_status else ""
-    logger.info(f"API CALL [{api_name}] {method} {endpoint}{params_str}{status_str}")
+    logger.info("API CALL [%s] %s %s%s%s", api_name, method, endpoint, params_str, status_str)
 
 
 def log_user_interaction(logger, action, details=None):
@@ -155,8 +199,10 @@ def log_user_interaction(logger, action, details=None):
         action (str): User action description
         details: Additional details about the interaction
     """
+    if not logger.isEnabledFor(logging.INFO):
+        return
     details_str = f" - {details}" if details else ""
-    logger.info(f"USER ACTION: {action}{details_str}")
+    logger.info("USER ACTION: %s%s", action, details_str)
 
 
 def log_error_with_context(logger, error, context=None, function=None):
@@ -169,9 +215,11 @@ def log_error_with_context(logger, error, context=None, function=None):
         context (dict): Additional context information
         function (str): Function where error occurred
     """
+    if not logger.isEnabledFor(logging.ERROR):
+        return
     function_str = f" in {function}" if function else ""
     context_str = f" | Context: {context}" if context else ""
-    logger.error(f"ERROR{function_str}: {error}{context_str}")
+    logger.error("ERROR%s: %s%s", function_str, error, context_str)
 
 
 def log_performance_metric(logger, operation, duration, details=None):
@@ -184,8 +232,10 @@ def log_performance_metric(logger, operation, duration, details=None):
         duration (float): Duration in seconds
         details: Additional performance details
     """
+    if not logger.isEnabledFor(logging.INFO):
+        return
     details_str = f" | {details}" if details else ""
-    logger.info(f"PERFORMANCE: {operation} completed in {duration:.3f}s{details_str}")
+    logger.info("PERFORMANCE: %s completed in %.3fs%s", operation, duration, details_str)
 
 
 def log_data_summary(logger, data_type, count, sample=None):
@@ -198,8 +248,10 @@ def log_data_summary(logger, data_type, count, sample=None):
         count (int): Number of items
         sample: Sample of the data for logging
     """
+    if not logger.isEnabledFor(logging.INFO):
+        return
     sample_str = f" | Sample: {sample}" if sample else ""
-    logger.info(f"DATA SUMMARY: Retrieved {count} {data_type}{sample_str}")
+    logger.info("DATA SUMMARY: Retrieved %s %s%s", count, data_type, sample_str)
 
 
 class SpotifyAgentLoggerAdapter(logging.LoggerAdapter):
@@ -207,11 +259,22 @@ class SpotifyAgentLoggerAdapter(logging.LoggerAdapter):
     Custom logger adapter for Spotify Agent with additional context
     """
     
-    def process(self, msg, kwargs):
-        """Add session context to log messages"""
+    def __init__(self, logger, extra=None):
+        """
+        Initialize the adapter and build its message prefix once
+        
+        Args:
+            logger: Logger instance to wrap
+            extra (dict): Session context with 'session_id' and 'user_id'
+        """
+        super().__init__(logger, extra or {})
         session_id = self.extra.get('session_id', 'unknown')
         user_id = self.extra.get('user_id', 'unknown')
-        return f"[Session:{session_id}|User:{user_id}] {msg}", kwargs
+        self._prefix = f"[Session:{session_id}|User:{user_id}] "
+    
+    def process(self, msg, kwargs):
+        """Add session context to log messages"""
+        return f"{self._prefix}{msg}", kwargs
 
 
 if __name__ == "__main__":
@@ -4,10 +4,11 @@ Spotify Agent - Chat Interface
 A chat-based CLI for music recommendations using Spotify and OpenAI
 """
 
+import os
 import sys
 import time
-from spotify_client import SpotifyClient
-from openai_client import OpenAIClient
+import logging
+from dotenv import load_dotenv
 from chat_cli import SpotifyAgentCLI
 from logging_config import (
     setup_logging, 
@@ -15,8 +16,11 @@ from logging_config import (
     log_user_interaction
 )
 
-# Initialize logging system
-app_logger, log_file_path = setup_logging()
+# Initialize logging system. SPOTIFY_AGENT_DEBUG (set in the environment or
+# .env) logs at DEBUG level, which includes the full context sent to GPT
+load_dotenv()
+debug_logging = bool(os.environ.get("SPOTIFY_AGENT_DEBUG"))
+app_logger, log_file_path = setup_logging(logging.DEBUG if debug_logging else logging.INFO)
 logger = get_logger('main')
 
 
@@ -7,7 +7,7 @@ Handles OpenAI API interactions for music recommendations
 import os
 import sys
 import time
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Iterator
 from openai import OpenAI
 from dotenv import load_dotenv
 from logging_config import (
@@ -23,6 +23,49 @@ from logging_config import (
 # Get configured logger
 logger = get_logger('openai_client')
 
+# System prompt sent first in every request; built once and shared since it
+# never changes, which also keeps the cached request prefix identical
+SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": """You are a music recommendation expert. You help users discover new music based on their preferences. 
+                When suggesting songs, provide:
+                1. Song name
+                2. Artist name
+                3. Brief reason why they might like it
+                
+                Be enthusiastic and helpful in your recommendations. Use emojis to make responses engaging."""
+}
+
+# Context window in tokens by model name prefix, most specific prefix first;
+# used when OPENAI_CONTEXT_WINDOW is not set
+MODEL_CONTEXT_WINDOWS = (
+    ("gpt-4.1", 1047576),
+    ("gpt-4o", 128000),
+    ("gpt-4-turbo", 128000),
+    ("gpt-4-32k", 32768),
+    ("gpt-4", 8192),
+    ("gpt-3.5-turbo", 16385),
+)
+
+# Window assumed for models not listed above
+DEFAULT_CONTEXT_WINDOW = 8192
+
+
+def model_context_window(model: str) -> int:
+    """
+    Look up the context window of an OpenAI model
+    
+    Args:
+        model (str): Model name, e.g. "gpt-4" or "gpt-4o-mini"
+        
+    Returns:
+        int: Context window in tokens
+    """
+    for prefix, window in MODEL_CONTEXT_WINDOWS:
+        if model.startswith(prefix):
+            return window
+    return DEFAULT_CONTEXT_WINDOW
+
 
 class OpenAIClient:
     """
@@ -39,6 +82,8 @@ class OpenAIClient:
         self.model = os.getenv('OPENAI_MODEL', 'gpt-3.5-turbo')
         self.max_tokens = int(os.getenv('OPENAI_MAX_TOKENS', '2000'))
         self.temperature = float(os.getenv('OPENAI_TEMPERATURE', '0.7'))
+        context_window = os.getenv('OPENAI_CONTEXT_WINDOW')
+        self.context_window = int(context_window) if context_window else model_context_window(self.model)
         self.org_id = os.getenv('OPENAI_ORG_ID')
         
         # Validate required environment variables
@@ -64,9 +109,6 @@ class OpenAIClient:
                 organization=self.org_id if self.org_id else None
             )
             
-            # Test the connection with a simple request
-            self._test_connection(client)
-            
             logger.info(f"Successfully initialized OpenAI client with model: {self.model}")
             return client
             
@@ -74,83 +116,107 @@ class OpenAIClient:
             logger.error(f"Failed to initialize OpenAI client: {e}")
             raise
     
-    def _test_connection(self, client: OpenAI) -> None:
+    def _build_messages(self, prompt: Optional[str] = None,
+                        messages: Optional[List[Dict[str, str]]] = None) -> List[Dict[str, str]]:
         """
-        Test the OpenAI connection with a simple request
+        Build the request messages for a prompt or an existing conversation
+        
+        The system prompt always comes first so the request prefix stays
+        identical between turns; the conversation is appended unchanged.
         
         Args:
-            client: OpenAI client instance
+            prompt (Optional[str]): Single user prompt
+            messages (Optional[List[Dict[str, str]]]): Conversation in Chat Completions format
+            
+        Returns:
+            List[Dict[str, str]]: Messages for the Chat Completions API
         """
-        try:
-            # Simple test request
-            response = client.chat.completions.create(
-                model=self.model,
-                messages=[{"role": "user", "content": "Hello"}],
-                max_tokens=10,
-                temperature=0
-            )
+        if messages is None:
+            messages = [{"role": "user", "content": prompt}]
+        
+        return [SYSTEM_MESSAGE, *messages]
+    
+    def _cache_options(self, prompt_cache_key: Optional[str]) -> Dict[str, Any]:
+        """
+        Build the extra request options for prompt cache routing
+        
+        Args:
+            prompt_cache_key (Optional[str]): Stable per-user cache key
             
-            if response.choices and response.choices[0].message.content:
-                logger.info("OpenAI connection test successful")
-            else:
-                raise Exception("No response received from OpenAI")
-                
-        except Exception as e:
-            logger.error(f"OpenAI connection test failed: {e}")
-            raise
+        Returns:
+            Dict[str, Any]: Keyword arguments for chat.completions.create
+        """
+        if not prompt_cache_key:
+            return {}
+        return {"extra_body": {"prompt_cache_key": prompt_cache_key}}
     
-    def chat(self, prompt: str) -> str:
+    def chat(self, prompt: Optional[str] = None,
+             messages: Optional[List[Dict[str, str]]] = None,
+             prompt_cache_key: Optional[str] = None) -> str:
         """
-        Send a user prompt to GPT and return the response
+        Send a user prompt or a conversation to GPT and return the response
         
         Args:
-            prompt (str): User's input prompt
+            prompt (Optional[str]): User's input prompt
+            messages (Optional[List[Dict[str, str]]]): Conversation history with
+                system/user/assistant roles, used instead of prompt
+            prompt_cache_key (Optional[str]): Stable per-user key that routes
+                requests sharing a prefix to the same prompt cache
             
         Returns:
             str: GPT's response
         """
-        try:
-            logger.info(f"Processing prompt: {prompt[:50]}...")
+        # Collect the streamed deltas so both methods share one request path
+        gpt_response = "".join(self.chat_stream(prompt, messages, prompt_cache_key)).strip()
+        if gpt_response:
+            return gpt_response
+        
+        error_msg = "No response content received from OpenAI"
+        logger.error(error_msg)
+        return f"Sorry, I encountered an error: {error_msg}"
+    
+    def chat_stream(self, prompt: Optional[str] = None,
+                    messages: Optional[List[Dict[str, str]]] = None,
+                    prompt_cache_key: Optional[str] = None) -> Iterator[str]:
+        """
+        Send a user prompt or a conversation to GPT and yield the response as it is generated
+        
+        Args:
+            prompt (Optional[str]): User's input prompt
+            messages (Optional[List[Dict[str, str]]]): Conversation history with
+                system/user/assistant roles, used instead of prompt
+            prompt_cache_key (Optional[str]): Stable per-user key that routes
+                requests sharing a prefix to the same prompt cache
             
-            # Create the conversation context
-            messages = [
-                {
-                    "role": "system",
-                    "content": """You are a music recommendation expert. You help users discover new music based on their preferences. 
-                    When suggesting songs, provide:
-                    1. Song name
-                    2. Artist name
-                    3. Brief reason why they might like it
-                    
-                    Be enthusiastic and helpful in your recommendations. Use emojis to make responses engaging."""
-                },
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ]
+        Yields:
+            str: Response text deltas in the order they arrive
+        """
+        try:
+            request_messages = self._build_messages(prompt, messages)
+            preview = request_messages[-1]['content'][:50]
+            logger.info(f"Streaming response for prompt: {preview}...")
             
-            # Make the API call
-            response = self.client.chat.completions.create(
+            stream = self.client.chat.completions.create(
                 model=self.model,
-                messages=messages,
+                messages=request_messages,
                 max_tokens=self.max_tokens,
-                temperature=self.temperature
+                temperature=self.temperature,
+                stream=True,
+                **self._cache_options(prompt_cache_key)
             )
             
-            # Extract the response
-            if response.choices and response.choices[0].message.content:
-                gpt_response = response.choices[0].message.content.strip()
-                logger.info(f"Generated response for prompt: {prompt[:50]}...")
-                return gpt_response
-            else:
-                error_msg = "No response content received from OpenAI"
-                logger.error(error_msg)
-                return f"Sorry, I encountered an error: {error_msg}"
+            for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    yield delta
+            
+            logger.info(f"Finished streaming response for prompt: {preview}...")
                 
         except Exception as e:
-            logger.error(f"Failed to get response from OpenAI: {e}")
-            return f"Sorry, I encountered an error while processing your request: {str(e)}"
+            logger.error(f"Failed to stream response from OpenAI: {e}")
+            yield f"Sorry, I encountered an error while processing your request: {str(e)}"
     
     # def get_music_recommendations(self, artists: List[str], genres: Optional[List[str]] = None, 
     #                              mood: Optional[str] = None, count: int = 5) -> str:
@@ -239,14 +305,11 @@ class OpenAIClient:
             bool: True if connection is successful, False otherwise
         """
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[{"role": "user", "content": "Test"}],
-                max_tokens=10,
-                temperature=0
-            )
+            # Retrieving the configured model checks the API key and model
+            # access with a metadata GET instead of a paid chat completion
+            model = self.client.models.retrieve(self.model)
             
-            if response.choices and response.choices[0].message.content:
+            if model and model.id:
                 logger.info("OpenAI connection test successful")
                 return True
             else:
@@ -5,11 +5,19 @@ Handles OAuth authentication and basic user information retrieval
 """
 
 import os
+import random
+import re
 import sys
+import threading
 import time
-from typing import Optional, Dict, Any, List
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from datetime import datetime
+from typing import Optional, Dict, Any, List, Tuple, Callable
+import requests
 import spotipy
+from requests.adapters import HTTPAdapter
 from spotipy.oauth2 import SpotifyOAuth
+from urllib3.util.retry import Retry
 from dotenv import load_dotenv
 from logging_config import (
     get_logger,
@@ -24,6 +32,165 @@ from logging_config import (
 # Get configured logger
 logger = get_logger('spotify_client')
 
+# Maximum number of concurrent Spotify searches, kept low to respect rate limits
+MAX_SEARCH_WORKERS = 10
+
+# Patterns to match the track formats GPT uses:
+# 1. "Song Name" by Artist Name
+# 2. **"Song Name" by Artist Name**
+# 3. 1. Song Name - Artist Name
+# 4. • Song Name by Artist Name
+# 5. Song: "Title" Artist: Name
+_TRACK_PATTERNS = [re.compile(pattern, re.IGNORECASE | re.MULTILINE | re.DOTALL) for pattern in (
+    # Pattern 1: **"Song Name"** by Artist Name (most common GPT format)
+    r'\d+\.\s*\*\*["\'""]([^"\'""]+)["\'""]?\*\*\s+by\s+([^\n\-–—•*]+?)(?:\s*\n|$)',
+    # Pattern 2: "Song Name" by Artist Name or **"Song Name" by Artist Name**
+    r'(?:\*\*)?["\'""]([^"\'""]+)["\'""](?:\*\*)?\s+by\s+([^\n\-–—•*\-]+?)(?:\s*[\-–—\n]|$)',
+    # Pattern 3: Number. Song Name - Artist Name or • Song Name - Artist Name  
+    r'(?:\d+\.|\•|\*)\s*([^-–—\n]+?)\s*[\-–—]\s*([^\n•*]+?)(?:\s*[\-–—\n]|$)',
+    # Pattern 4: Number. Song Name by Artist Name
+    r'(?:\d+\.|\•|\*)\s*([^-–—\n]+?)\s+by\s+([^\n•*\-]+?)(?:\s*[\-–—\n]|$)',
+    # Pattern 5: Song: "Title" \n Artist: Name (handle GPT's format)
+    r'Song:\s*["\'""]([^"\'""]+)["\'""].*?Artist:\s*([^\n•*🎵\-]+?)(?:\n|$)',
+    # Pattern 6: Number. Song: "Title" \n Artist: Name
+    r'\d+\.\s*Song:\s*["\'""]([^"\'""]+)["\'""].*?Artist:\s*([^\n•*🎵\-]+?)(?:\n|$)',
+    # Pattern 7: Song: Title (without quotes) \n Artist: Name
+    r'Song:\s*([^"\n]+?)(?:\n.*?)?Artist:\s*([^\n•*🎵\-]+?)(?:\n|$)'
+)]
+
+# Wrapping characters stripped from both ends of parsed names
+_NAME_STRIP_CHARS = ' \t\r\n*"\''
+
+# Leading list markers left on a parsed track name
+_TRACK_PREFIX_CHARS = '0123456789.)]}-–— \t\r\n'
+
+# Artist name cleanups, applied in order
+_ARTIST_CLEANUP_RES = [re.compile(pattern) for pattern in (
+    r'[\-–—]\s.*$',     # Stop at dash + description
+    r'\s+by\s.*$',      # Remove duplicate "by" patterns
+    r'\s*\([^)]*\).*$',  # Remove parentheses
+    r'🎵.*$',           # Remove emojis and text after
+    r'\n.*$',           # Stop at newlines
+)]
+
+# Description openers that leak into parsed artist names
+_ARTIST_STOP_WORDS = ('A powerful', 'An anthemic', 'A soulful', 'A feel', 'A classic', 'by A', 'by An')
+
+# Retries for a rate-limited (HTTP 429) Spotify call, and the first backoff
+# delay in seconds when Spotify sends no Retry-After header
+MAX_RATE_LIMIT_RETRIES = 4
+RATE_LIMIT_BACKOFF_BASE = 1.0
+
+# Refresh the access token once it is this close to expiring (seconds)
+TOKEN_REFRESH_MARGIN = 60
+
+# Minimum time between refresh attempts while the current token is still valid (seconds)
+MIN_TOKEN_REFRESH_INTERVAL = 5 * 60
+
+# Keep-alive connections kept open to the Spotify API
+HTTP_POOL_SIZE = 32
+
+# Authenticated spotipy clients shared by every SpotifyClient, keyed by
+# (client_id, scopes) so repeated constructions reuse one OAuth session
+_SP_SINGLETON: Dict[Tuple[str, str], spotipy.Spotify] = {}
+_SP_SINGLETON_LOCK = threading.Lock()
+
+
+def _build_http_session() -> requests.Session:
+    """
+    Build the HTTP session shared by all Spotify clients
+    
+    Connections are pooled and kept alive, so concurrent searches reuse
+    TCP/TLS connections instead of opening a new one per request.
+    Connection errors and 5xx responses on idempotent requests are retried
+    here; rate limits (429) are handled by SpotifyClient._with_backoff.
+    
+    Returns:
+        requests.Session: Session with a pooled, retrying HTTPS adapter
+    """
+    retry = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=(500, 502, 503, 504),
+        respect_retry_after_header=False,
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE, max_retries=retry)
+    
+    session = requests.Session()
+    session.mount('https://', adapter)
+    return session
+
+
+# HTTP session shared by every spotipy client
+_HTTP_SESSION = _build_http_session()
+
+
+class InMemoryTokenOAuth(SpotifyOAuth):
+    """
+    SpotifyOAuth that keeps the current token in memory
+    
+    spotipy asks the auth manager for a token on every request, which normally
+    reads and parses the .spotify_cache file each time. The token is reused here
+    until it is within TOKEN_REFRESH_MARGIN seconds of expiring. Every new token
+    comes from, or is written to, the cache handler, so the in-memory token and
+    .spotify_cache never disagree.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._tok: Optional[Dict[str, Any]] = None
+        self._last_refresh = 0.0
+        # Refresh token to use for the next fetch after invalidate_token()
+        self._pending_refresh: Optional[str] = None
+    
+    def get_access_token(self, code=None, as_dict=True, check_cache=True):
+        """
+        Get an access token, reusing the in-memory one while it is fresh
+        
+        Args:
+            code: Authorization code from the OAuth redirect, if any
+            as_dict (bool): Return the full token info instead of the access token
+            check_cache (bool): Let spotipy read its token cache when refreshing
+            
+        Returns:
+            The token info dict if as_dict, otherwise the access token string
+        """
+        now = time.time()
+        if self._tok and code is None:
+            expires_in = self._tok['expires_at'] - now
+            # Still fresh, or still valid and refreshed too recently to try again
+            if expires_in > TOKEN_REFRESH_MARGIN or (
+                    expires_in > 0 and now - self._last_refresh < MIN_TOKEN_REFRESH_INTERVAL):
+                return self._tok if as_dict else self._tok['access_token']
+        
+        self._last_refresh = now
+        if code is None and self._pending_refresh:
+            # The cached token was rejected, so .spotify_cache would only hand
+            # it back; refresh it instead (spotipy saves the new token there)
+            refresh_token, self._pending_refresh = self._pending_refresh, None
+            token_info = self.refresh_access_token(refresh_token)
+        elif as_dict:
+            token_info = super().get_access_token(code, as_dict=True, check_cache=check_cache)
+        else:
+            access_token = super().get_access_token(code, as_dict=False, check_cache=check_cache)
+            # spotipy read the token from, or just saved it to, the cache handler
+            token_info = self.cache_handler.get_cached_token()
+            if not token_info or token_info.get('access_token') != access_token:
+                # The cache could not be written; keep nothing in memory
+                self._tok = None
+                return access_token
+        
+        self._tok = token_info
+        return token_info if as_dict else token_info['access_token']
+    
+    def invalidate_token(self) -> None:
+        """Drop the current token so the next request refreshes it"""
+        token_info = self._tok or self.cache_handler.get_cached_token()
+        self._pending_refresh = token_info.get('refresh_token') if token_info else None
+        self._tok = None
+        self._last_refresh = 0.0
+
 
 class SpotifyClient:
     """
@@ -31,7 +198,7 @@ class SpotifyClient:
     """
     
     def __init__(self):
-        """Initialize the Spotify client with OAuth authentication"""
+        """Initialize the Spotify client; OAuth is set up on first API use"""
         log_function_entry(logger, "__init__")
         start_time = time.time()
         
@@ -46,9 +213,9 @@ class SpotifyClient:
             self.redirect_uri = os.getenv('SPOTIFY_REDIRECT_URI', 'http://localhost:8888/callback')
             self.scopes = os.getenv('SPOTIFY_SCOPES', 'user-read-private user-read-email user-read-recently-played user-top-read playlist-modify-public playlist-modify-private')
             
-            logger.debug(f"Loaded credentials - Client ID: {'*' * len(self.client_id) if self.client_id else 'None'}")
-            logger.debug(f"Redirect URI: {self.redirect_uri}")
-            logger.debug(f"Scopes: {self.scopes}")
+            logger.debug("Loaded credentials - Client ID: %s", '*' * len(self.client_id) if self.client_id else 'None')
+            logger.debug("Redirect URI: %s", self.redirect_uri)
+            logger.debug("Scopes: %s", self.scopes)
             
             # Validate required environment variables
             if not self.client_id or not self.client_secret:
@@ -66,28 +233,68 @@ class SpotifyClient:
             
             logger.info("Spotify credentials validated successfully")
             
-            # Initialize Spotify client with OAuth
-            self.sp = self._initialize_spotify_client()
+            # Spotify user ID, filled in once the user profile is fetched
+            self.user_id = None
+            
+            # current_user() response and search results, kept for the session
+            self._user_cache = None
+            self._search_cache: Dict[Tuple[str, str], Optional[Dict[str, Any]]] = {}
+            
+            # spotipy client, created with OAuth on first use (see the sp property)
+            self._sp: Optional[spotipy.Spotify] = None
             
             duration = time.time() - start_time
-            log_performance_metric(logger, "spotify_client_initialization", duration, "OAuth setup completed")
+            log_performance_metric(logger, "spotify_client_initialization", duration, "Credentials loaded")
             log_function_exit(logger, "__init__", "SpotifyClient initialized", True)
             
         except Exception as e:
             log_error_with_context(logger, e, {"stage": "initialization"}, "__init__")
             log_function_exit(logger, "__init__", None, False)
             raise
+    
+    @property
+    def sp(self) -> spotipy.Spotify:
+        """
+        Authenticated spotipy client, created on first access
+        
+        Returns:
+            spotipy.Spotify: Authenticated Spotify client
+        """
+        if self._sp is None:
+            start_time = time.time()
+            self._sp = self._initialize_spotify_client()
+            log_performance_metric(logger, "spotify_oauth_setup", time.time() - start_time, "OAuth setup completed")
+        return self._sp
         
     def _initialize_spotify_client(self) -> spotipy.Spotify:
         """
         Initialize Spotify client with OAuth authentication
         
+        Clients are shared per (client_id, scopes), so only the first
+        SpotifyClient for a set of credentials builds a new one.
+        
+        Returns:
+            spotipy.Spotify: Authenticated Spotify client
+        """
+        key = (self.client_id, self.scopes)
+        with _SP_SINGLETON_LOCK:
+            sp = _SP_SINGLETON.get(key)
+            if sp is None:
+                sp = _SP_SINGLETON[key] = self._create_spotify_client()
+            else:
+                logger.debug("Reusing existing Spotify client")
+        return sp
+    
+    def _create_spotify_client(self) -> spotipy.Spotify:
+        """
+        Create a new Spotify client with its own OAuth manager
+        
         Returns:
             spotipy.Spotify: Authenticated Spotify client
         """
         try:
             # Create OAuth manager
-            oauth_manager = SpotifyOAuth(
+            oauth_manager = InMemoryTokenOAuth(
                 client_id=self.client_id,
                 client_secret=self.client_secret,
                 redirect_uri=self.redirect_uri,
@@ -95,19 +302,73 @@ class SpotifyClient:
                 cache_path='.spotify_cache'  # Cache tokens locally
             )
             
-            # Create Spotify client
-            sp = spotipy.Spotify(auth_manager=oauth_manager)
+            # Create Spotify client; the first real API call authenticates
+            sp = spotipy.Spotify(auth_manager=oauth_manager, requests_session=_HTTP_SESSION)
             
-            # Test the connection
-            sp.current_user()
-            
-            logger.info("Successfully authenticated with Spotify")
+            logger.info("Initialized Spotify client with OAuth")
             return sp
             
         except Exception as e:
             logger.error(f"Failed to initialize Spotify client: {e}")
             raise
     
+    def _current_user_cached(self) -> Dict[str, Any]:
+        """
+        Get the current user's profile, fetching it from Spotify only once
+        
+        Returns:
+            Dict[str, Any]: Raw current_user() response
+        """
+        if self._user_cache is None:
+            self._user_cache = self._with_backoff(self.sp.current_user)
+            self.user_id = self._user_cache.get('id')
+        return self._user_cache
+    
+    def _clear_caches(self) -> None:
+        """Forget the cached user profile and search results"""
+        self._user_cache = None
+        self._search_cache.clear()
+    
+    def _with_backoff(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Call a spotipy method, retrying when rate limited or the token is rejected
+        
+        On HTTP 429 the call is retried after Retry-After seconds (or an
+        exponential backoff) plus jitter, up to MAX_RATE_LIMIT_RETRIES times.
+        On HTTP 401 the cached data is dropped, the access token is refreshed
+        and the call is retried once.
+        
+        Args:
+            fn (Callable[..., Any]): Bound spotipy method to call
+            *args: Positional arguments for fn
+            **kwargs: Keyword arguments for fn
+            
+        Returns:
+            Any: Result of fn
+        """
+        rate_limit_retries = 0
+        token_retried = False
+        
+        while True:
+            try:
+                return fn(*args, **kwargs)
+            except spotipy.SpotifyException as e:
+                if e.http_status == 429 and rate_limit_retries < MAX_RATE_LIMIT_RETRIES:
+                    retry_after = (e.headers or {}).get('Retry-After')
+                    delay = float(retry_after) if retry_after else RATE_LIMIT_BACKOFF_BASE * 2 ** rate_limit_retries
+                    delay += random.random()
+                    rate_limit_retries += 1
+                    logger.warning("Spotify rate limit hit, retrying in %.1fs (attempt %d/%d)",
+                                   delay, rate_limit_retries, MAX_RATE_LIMIT_RETRIES)
+                    time.sleep(delay)
+                elif e.http_status == 401 and not token_retried:
+                    token_retried = True
+                    logger.warning("Spotify returned 401, refreshing token and retrying")
+                    self._clear_caches()
+                    self.sp.auth_manager.invalidate_token()
+                else:
+                    raise
+    
     def get_user_info(self) -> Dict[str, Any]:
         """
         Get current user's information
@@ -116,7 +377,7 @@ class SpotifyClient:
             Dict[str, Any]: User information including display name, email, etc.
         """
         try:
-            user = self.sp.current_user()
+            user = self._current_user_cached()
             
             user_info = {
                 'id': user.get('id'),
@@ -128,7 +389,7 @@ class SpotifyClient:
                 'images': user.get('images', [])
             }
             
-            logger.info(f"Retrieved user info for: {user_info['display_name']}")
+            logger.info("Retrieved user info for: %s", user_info['display_name'])
             return user_info
             
         except Exception as e:
@@ -138,23 +399,34 @@ class SpotifyClient:
     def print_user_info(self) -> None:
         """Print user information in a formatted way"""
         try:
-            user_info = self.get_user_info()
-            
-            print("\n" + "="*50)
-            print("🎵 SPOTIFY CONNECTION SUCCESSFUL 🎵")
-            print("="*50)
-            print(f"👤 Display Name: {user_info['display_name']}")
-            print(f"📧 Email: {user_info['email']}")
-            print(f"🌍 Country: {user_info['country']}")
-            print(f"💎 Subscription: {user_info['product'].title()}")
-            print(f"👥 Followers: {user_info['followers']}")
-            
-            if user_info['images']:
-                print(f"🖼️  Profile Image: {user_info['images'][0]['url']}")
-            
-            print("="*50)
-            print("✅ Ready to provide music recommendations!")
-            print("="*50 + "\n")
+            # Render straight from the cached profile; the fields are used once
+            user = self._current_user_cached()
+            
+            lines = [
+                "",
+                "="*50,
+                "🎵 SPOTIFY CONNECTION SUCCESSFUL 🎵",
+                "="*50,
+                f"👤 Display Name: {user.get('display_name')}",
+                f"📧 Email: {user.get('email')}",
+                f"🌍 Country: {user.get('country')}",
+                f"💎 Subscription: {user.get('product').title()}",
+                f"👥 Followers: {user.get('followers', {}).get('total', 0)}",
+            ]
+            
+            images = user.get('images')
+            if images:
+                lines.append(f"🖼️  Profile Image: {images[0]['url']}")
+            
+            lines += [
+                "="*50,
+                "✅ Ready to provide music recommendations!",
+                "="*50,
+                "",
+            ]
+            
+            # Write the whole block at once instead of one print per line
+            sys.stdout.write("\n".join(lines) + "\n")
             
         except Exception as e:
             logger.error(f"Failed to print user info: {e}")
@@ -169,7 +441,7 @@ class SpotifyClient:
         """
         try:
             # Try to get current user
-            user = self.sp.current_user()
+            user = self._current_user_cached()
             if user and user.get('id'):
                 logger.info("Spotify connection test successful")
                 return True
@@ -198,7 +470,7 @@ class SpotifyClient:
                 limit = 50
             
             # Get tracks from Spotify
-            recent_tracks = self.sp.current_user_recently_played(limit=limit)
+            recent_tracks = self._with_backoff(self.sp.current_user_recently_played, limit=limit)
             tracks = []
             
             # Process tracks
@@ -211,7 +483,7 @@ class SpotifyClient:
                     'played_at': item['played_at']
                 })
             
-            logger.info(f"Retrieved {len(tracks)} recent tracks")
+            logger.info("Retrieved %d recent tracks", len(tracks))
             return tracks
             
         except Exception as e:
@@ -230,7 +502,8 @@ class SpotifyClient:
             list: List of top artists
         """
         try:
-            top_artists = self.sp.current_user_top_artists(
+            top_artists = self._with_backoff(
+                self.sp.current_user_top_artists,
                 limit=limit, 
                 time_range=time_range
             )
@@ -244,29 +517,76 @@ class SpotifyClient:
                     'followers': artist['followers']['total']
                 })
             
-            logger.info(f"Retrieved {len(artists)} top artists")
+            logger.info("Retrieved %d top artists", len(artists))
             return artists
             
         except Exception as e:
             logger.error(f"Failed to get top artists: {e}")
             return []
     
-    def create_recommendation_playlist_from_text(self, gpt_text: str) -> Dict[str, Any]:
+    def search_track(self, track_name: str, artist_name: str,
+                     key: Optional[Tuple[str, str]] = None) -> Optional[Dict[str, Any]]:
+        """
+        Search Spotify for a single track
+        
+        Args:
+            track_name (str): Track title
+            artist_name (str): Artist name
+            key (Optional[Tuple[str, str]]): Precomputed casefolded (track, artist)
+                key, as in the '_key' of parsed tracks
+            
+        Returns:
+            Optional[Dict[str, Any]]: Best matching Spotify track, or None if not found
+        """
+        # The same recommendation is often regenerated, so reuse earlier results
+        cache_key = key or (track_name.strip().casefold(), artist_name.strip().casefold())
+        if cache_key in self._search_cache:
+            return self._search_cache[cache_key]
+        
+        query = f"track:{track_name} artist:{artist_name}"
+        results = self._with_backoff(self.sp.search, q=query, type='track', limit=1)
+        
+        items = results['tracks']['items']
+        track = items[0] if items else None
+        self._search_cache[cache_key] = track
+        return track
+    
+    def prefetch_tracks_from_text(self, text: str, executor: Executor,
+                                  pending: Dict[Tuple[str, str], Future]) -> None:
+        """
+        Start Spotify searches for tracks mentioned in (partial) GPT text
+        
+        Searches already in `pending` are not submitted again, so this can be
+        called repeatedly while a response is still being streamed.
+        
+        Args:
+            text (str): GPT recommendation text received so far
+            executor (Executor): Executor that runs the searches
+            pending (Dict[Tuple[str, str], Future]): Casefolded (track, artist) key ->
+                search future, updated in place
+        """
+        for track_info in self._parse_tracks_from_text(text):
+            key = track_info['_key']
+            if key not in pending:
+                pending[key] = executor.submit(self.search_track, track_info['track'],
+                                               track_info['artist'], key)
+    
+    def create_recommendation_playlist_from_text(self, gpt_text: str,
+                                                 prefetched: Optional[Dict[Tuple[str, str], Future]] = None) -> Dict[str, Any]:
         """
         Create a Spotify playlist from GPT recommendation text
         
         Args:
             gpt_text (str): GPT response containing song and artist recommendations
+            prefetched (Optional[Dict[Tuple[str, str], Future]]): Searches already started
+                by prefetch_tracks_from_text; any other track is searched here
             
         Returns:
             Dict[str, Any]: Playlist metadata including name, URL, and track count
         """
-        import re
-        from datetime import datetime
-        
         try:
             log_function_entry(logger, "create_recommendation_playlist_from_text")
-            logger.info(f"Creating playlist from GPT text: {gpt_text[:100]}...")
+            logger.info("Creating playlist from GPT text: %.100s...", gpt_text)
             
             # Parse track information from GPT text
             tracks_info = self._parse_tracks_from_text(gpt_text)
@@ -278,60 +598,76 @@ class SpotifyClient:
                     'tracks_added': 0
                 }
             
-            logger.info(f"Parsed {len(tracks_info)} tracks from text")
+            logger.info("Parsed %d tracks from text", len(tracks_info))
             
             # Get current user info
-            user = self.sp.current_user()
+            user = self._current_user_cached()
             user_id = user['id']
             
             # Create playlist name with current date
             playlist_name = f"AI Recommendations - {datetime.now().strftime('%Y-%m-%d')}"
             
-            # Create the playlist
-            playlist = self.sp.user_playlist_create(
-                user=user_id,
-                name=playlist_name,
-                public=False,  # Private by default
-                description="AI-generated music recommendations from Spotify Agent"
-            )
-            
-            logger.info(f"Created playlist: {playlist_name} (ID: {playlist['id']})")
-            
             # Search for tracks and collect URIs
             track_uris = []
             successful_tracks = []
             failed_tracks = []
             
-            for track_info in tracks_info:
-                try:
-                    # Search for the track
-                    query = f"track:{track_info['track']} artist:{track_info['artist']}"
-                    results = self.sp.search(q=query, type='track', limit=1)
-                    
-                    if results['tracks']['items']:
-                        track = results['tracks']['items'][0]
-                        track_uris.append(track['uri'])
-                        successful_tracks.append({
-                            'searched': f"{track_info['track']} by {track_info['artist']}",
-                            'found': f"{track['name']} by {track['artists'][0]['name']}"
-                        })
-                        logger.debug(f"Found track: {track['name']} by {track['artists'][0]['name']}")
-                    else:
-                        failed_tracks.append(f"{track_info['track']} by {track_info['artist']}")
-                        logger.warning(f"Track not found: {track_info['track']} by {track_info['artist']}")
+            # Create the playlist and run all searches concurrently, reusing
+            # any prefetched searches; one extra worker creates the playlist
+            with ThreadPoolExecutor(max_workers=MAX_SEARCH_WORKERS + 1) as executor:
+                playlist_future = executor.submit(
+                    self._with_backoff,
+                    self.sp.user_playlist_create,
+                    user=user_id,
+                    name=playlist_name,
+                    public=False,  # Private by default
+                    description="AI-generated music recommendations from Spotify Agent"
+                )
+                
+                search_futures = []
+                for track_info in tracks_info:
+                    key = track_info['_key']
+                    search_future = prefetched.get(key) if prefetched else None
+                    if search_future is None:
+                        search_future = executor.submit(self.search_track, track_info['track'],
+                                                        track_info['artist'], key)
+                    search_futures.append(search_future)
+                
+                # Collect results in the order the tracks were recommended
+                for track_info, search_future in zip(tracks_info, search_futures):
+                    try:
+                        track = search_future.result()
                         
-                except Exception as e:
-                    failed_tracks.append(f"{track_info['track']} by {track_info['artist']}")
-                    logger.error(f"Error searching for track {track_info['track']}: {e}")
+                        if track:
+                            track_uris.append(track['uri'])
+                            successful_tracks.append({
+                                'searched': f"{track_info['track']} by {track_info['artist']}",
+                                'found': f"{track['name']} by {track['artists'][0]['name']}"
+                            })
+                            logger.debug("Found track: %s by %s", track['name'], track['artists'][0]['name'])
+                        else:
+                            failed_tracks.append(f"{track_info['track']} by {track_info['artist']}")
+                            logger.warning("Track not found: %s by %s", track_info['track'], track_info['artist'])
+                            
+                    except Exception as e:
+                        failed_tracks.append(f"{track_info['track']} by {track_info['artist']}")
+                        logger.error(f"Error searching for track {track_info['track']}: {e}")
+                
+                # Searches and playlist creation have no dependency on each other
+                playlist = playlist_future.result()
+                logger.info("Created playlist: %s (ID: %s)", playlist_name, playlist['id'])
+            
+            # Different spellings can resolve to the same Spotify track; add each once
+            track_uris = list(dict.fromkeys(track_uris))
             
             # Add tracks to playlist
             if track_uris:
                 # Spotify allows max 100 tracks per request
                 for i in range(0, len(track_uris), 100):
                     batch = track_uris[i:i+100]
-                    self.sp.playlist_add_items(playlist['id'], batch)
+                    self._with_backoff(self.sp.playlist_add_items, playlist['id'], batch)
                 
-                logger.info(f"Added {len(track_uris)} tracks to playlist {playlist_name}")
+                logger.info("Added %d tracks to playlist %s", len(track_uris), playlist_name)
             
             # Log results
             log_data_summary(logger, "playlist_creation", {
@@ -367,7 +703,7 @@ class SpotifyClient:
                 'tracks_added': 0
             }
     
-    def _parse_tracks_from_text(self, text: str) -> List[Dict[str, str]]:
+    def _parse_tracks_from_text(self, text: str) -> List[Dict[str, Any]]:
         """
         Parse track and artist information from GPT recommendation text
         
@@ -375,68 +711,42 @@ class SpotifyClient:
             text (str): Text containing track recommendations
             
         Returns:
-            List[Dict[str, str]]: List of dictionaries with 'track' and 'artist' keys
+            List[Dict[str, Any]]: List of dictionaries with 'track' and 'artist' keys,
+                plus '_key', the casefolded (track, artist) tuple used for matching
         """
-        import re
-        
         tracks = []
+        seen = set()
         
-        # Pattern to match various formats:
-        # 1. "Song Name" by Artist Name
-        # 2. **"Song Name" by Artist Name**
-        # 3. 1. Song Name - Artist Name
-        # 4. • Song Name by Artist Name
-        # 5. Song: "Title" Artist: Name
-        patterns = [
-            # Pattern 1: **"Song Name"** by Artist Name (most common GPT format)
-            r'\d+\.\s*\*\*["\'""]([^"\'""]+)["\'""]?\*\*\s+by\s+([^\n\-–—•*]+?)(?:\s*\n|$)',
-            # Pattern 2: "Song Name" by Artist Name or **"Song Name" by Artist Name**
-            r'(?:\*\*)?["\'""]([^"\'""]+)["\'""](?:\*\*)?\s+by\s+([^\n\-–—•*\-]+?)(?:\s*[\-–—\n]|$)',
-            # Pattern 3: Number. Song Name - Artist Name or • Song Name - Artist Name  
-            r'(?:\d+\.|\•|\*)\s*([^-–—\n]+?)\s*[\-–—]\s*([^\n•*]+?)(?:\s*[\-–—\n]|$)',
-            # Pattern 4: Number. Song Name by Artist Name
-            r'(?:\d+\.|\•|\*)\s*([^-–—\n]+?)\s+by\s+([^\n•*\-]+?)(?:\s*[\-–—\n]|$)',
-            # Pattern 5: Song: "Title" \n Artist: Name (handle GPT's format)
-            r'Song:\s*["\'""]([^"\'""]+)["\'""].*?Artist:\s*([^\n•*🎵\-]+?)(?:\n|$)',
-            # Pattern 6: Number. Song: "Title" \n Artist: Name
-            r'\d+\.\s*Song:\s*["\'""]([^"\'""]+)["\'""].*?Artist:\s*([^\n•*🎵\-]+?)(?:\n|$)',
-            # Pattern 7: Song: Title (without quotes) \n Artist: Name
-            r'Song:\s*([^"\n]+?)(?:\n.*?)?Artist:\s*([^\n•*🎵\-]+?)(?:\n|$)'
-        ]
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE | re.MULTILINE | re.DOTALL)
-            for match in matches:
-                track_name = match[0].strip().strip('*').strip('"').strip("'").strip()
-                artist_name = match[1].strip().strip('*').strip('"').strip("'").strip()
+        for pattern in _TRACK_PATTERNS:
+            for match in pattern.findall(text):
+                track_name = match[0].strip(_NAME_STRIP_CHARS)
+                artist_name = match[1].strip(_NAME_STRIP_CHARS)
                 
                 # Clean up common artifacts
-                track_name = re.sub(r'^[\d\.\)\]\}\-–—\s]+', '', track_name).strip()
+                track_name = track_name.lstrip(_TRACK_PREFIX_CHARS).strip()
                 
                 # Enhanced artist name cleanup - stop at common separators
-                artist_name = re.sub(r'[\-–—]\s.*$', '', artist_name).strip()  # Stop at dash + description
-                artist_name = re.sub(r'\s+by\s.*$', '', artist_name).strip()  # Remove duplicate "by" patterns
-                artist_name = re.sub(r'\s*\([^)]*\).*$', '', artist_name).strip()  # Remove parentheses
-                artist_name = re.sub(r'🎵.*$', '', artist_name).strip()  # Remove emojis and text after
-                artist_name = re.sub(r'\n.*$', '', artist_name).strip()  # Stop at newlines
+                for cleanup_re in _ARTIST_CLEANUP_RES:
+                    artist_name = cleanup_re.sub('', artist_name).strip()
                 
                 # Remove common words that leak from descriptions
-                stop_words = ['A powerful', 'An anthemic', 'A soulful', 'A feel', 'A classic', 'by A', 'by An']
-                for word in stop_words:
+                for word in _ARTIST_STOP_WORDS:
                     if word in artist_name:
                         artist_name = artist_name.split(word)[0].strip()
                 
                 if track_name and artist_name and len(track_name) > 1 and len(artist_name) > 1:
                     # Avoid duplicates
-                    track_key = f"{track_name.lower()}|{artist_name.lower()}"
-                    if not any(f"{t['track'].lower()}|{t['artist'].lower()}" == track_key for t in tracks):
+                    track_key = (track_name.casefold(), artist_name.casefold())
+                    if track_key not in seen:
+                        seen.add(track_key)
                         tracks.append({
                             'track': track_name,
-                            'artist': artist_name
+                            'artist': artist_name,
+                            '_key': track_key
                         })
-                        logger.debug(f"Parsed track: {track_name} by {artist_name}")
+                        logger.debug("Parsed track: %s by %s", track_name, artist_name)
         
-        logger.info(f"Parsed {len(tracks)} unique tracks from text")
+        logger.info("Parsed %d unique tracks from text", len(tracks))
         return tracks
 
 
@@ -450,19 +760,29 @@ def main():
         
         # Test connection
         if client.test_connection():
-            # Print user information
-            client.print_user_info()
+            # Fetch recent tracks and top artists concurrently - both are
+            # independent network round-trips. The user profile is already
+            # cached by test_connection.
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                recent_future = executor.submit(client.get_recent_tracks, limit=10)
+                top_future = executor.submit(client.get_top_artists, limit=10, time_range='medium_term')
+                
+                # Print user information
+                client.print_user_info()
+                
+                recent_tracks = recent_future.result()
+                top_artists = top_future.result()
             
             # Show some recent tracks
-            print("📊 Recent Listening Activity:")
-            recent_tracks = client.get_recent_tracks(limit=10)
-            for i, track in enumerate(recent_tracks, 1):
-                print(f"  {i}. {track['name']} - {track['artist']}")
-            
-            print("\n🎤 Top Artists (Last 6 months):")
-            top_artists = client.get_top_artists(limit=10, time_range='medium_term')
-            for i, artist in enumerate(top_artists, 1):
-                print(f"  {i}. {artist['name']} ({', '.join(artist['genres'][:2])})")
+            lines = ["📊 Recent Listening Activity:"]
+            lines += [f"  {i}. {track['name']} - {track['artist']}"
+                      for i, track in enumerate(recent_tracks, 1)]
+            
+            lines.append("\n🎤 Top Artists (Last 6 months):")
+            lines += [f"  {i}. {artist['name']} ({', '.join(artist['genres'][:2])})"
+                      for i, artist in enumerate(top_artists, 1)]
+            
+            sys.stdout.write("\n".join(lines) + "\n")
             
         else:
             print("❌ Failed to connect to Spotify")
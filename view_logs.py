@@ -4,153 +4,355 @@ Log Viewer for Spotify Agent
 Simple utility to view and filter application logs
 """
 
+import io
 import os
+import re
 import sys
+import json
+import mmap
 import argparse
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
-import glob
+from functools import lru_cache
+
+
+# Log levels in the order they are checked and reported
+LOG_LEVELS = ("ERROR", "WARNING", "INFO", "DEBUG")
+
+# Level markers checked by the summary, in priority order
+LEVEL_MARKERS = tuple((level, f"| {level}") for level in LOG_LEVELS)
+
+# Activity markers checked by the summary, in priority order, with their labels
+ACTIVITY_MARKERS = (
+    ("API CALL", "API Calls"),
+    ("USER ACTION", "User Actions"),
+    ("PERFORMANCE", "Performance Metrics"),
+    ("ERROR", "Errors"),
+)
+
+# Component name after the logger prefix: the first token up to whitespace or "|"
+COMPONENT_PATTERN = re.compile(r"spotify_agent\.\s*([^\s|]*)")
+
+# Bytes read per step when reading a log file backward for --tail
+TAIL_CHUNK_SIZE = 64 * 1024
+
+# Summary counts are cached next to each log file; bump the version whenever
+# the counting rules change so old caches are ignored
+SUMMARY_CACHE_SUFFIX = ".summary.json"
+SUMMARY_CACHE_VERSION = 1
+
+# Leading bytes of a log file stored with its cached summary; the first line
+# starts with a timestamp, so a recreated file with the same inode is noticed
+SUMMARY_HEAD_BYTES = 256
+
+
+@lru_cache(maxsize=1)
+def _scan_log_dir(logs_dir, dir_mtime_ns):
+    """Return the log file paths in logs_dir; cached until the directory changes"""
+    with os.scandir(logs_dir) as it:
+        return tuple(entry.path for entry in it
+                     if entry.name.startswith("spotify_agent_") and entry.name.endswith(".log"))
 
 
 def list_log_files():
     """List all available log files"""
     logs_dir = "logs"
-    if not os.path.exists(logs_dir):
+    try:
+        dir_mtime_ns = os.stat(logs_dir).st_mtime_ns
+    except FileNotFoundError:
         print("❌ No logs directory found")
         return []
     
-    pattern = os.path.join(logs_dir, "spotify_agent_*.log")
-    log_files = glob.glob(pattern)
+    # Adding or removing a file changes the directory mtime, so the listing is
+    # only rescanned then; sizes and mtimes change on every write, so stat
+    # each file once here and reuse it
+    entries = [(log_file, os.stat(log_file)) for log_file in _scan_log_dir(logs_dir, dir_mtime_ns)]
     
-    if not log_files:
+    if not entries:
         print("❌ No log files found")
         return []
     
     # Sort by modification time (newest first)
-    log_files.sort(key=os.path.getmtime, reverse=True)
+    entries.sort(key=lambda entry: entry[1].st_mtime, reverse=True)
     
     print("📋 Available log files:")
-    for i, log_file in enumerate(log_files, 1):
-        mod_time = datetime.fromtimestamp(os.path.getmtime(log_file))
-        size = os.path.getsize(log_file)
-        print(f"  {i}. {log_file} ({size} bytes, modified: {mod_time.strftime('%Y-%m-%d %H:%M:%S')})")
+    for i, (log_file, st) in enumerate(entries, 1):
+        mod_time = datetime.fromtimestamp(st.st_mtime)
+        print(f"  {i}. {log_file} ({st.st_size} bytes, modified: {mod_time.strftime('%Y-%m-%d %H:%M:%S')})")
     
-    return log_files
+    return [log_file for log_file, _ in entries]
 
 
-def filter_logs(log_file, level=None, component=None, function=None, search_term=None):
-    """Filter and display logs based on criteria"""
+@contextmanager
+def map_log_file(log_file):
+    """Memory-map a log file read-only (an empty file yields b'')"""
+    with open(log_file, 'rb') as f:
+        # mmap cannot map an empty file
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b""
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
+
+
+def read_log_lines(log_file):
+    """Read a log file as a list of decoded lines, without line terminators"""
+    # Decoding the whole mapped file at once is much cheaper than decoding
+    # line by line, and str substring checks are several times faster than
+    # the same checks on bytes
+    with map_log_file(log_file) as data:
+        text = str(data, 'utf-8', 'replace')
+    
+    lines = text.split("\n")
+    if not lines[-1]:
+        # Trailing newline (or empty file)
+        lines.pop()
+    return lines
+
+
+def read_tail_bytes(log_file, n_lines):
+    """Return the last n_lines raw lines of a log file, reading backward from the end"""
+    fd = os.open(log_file, os.O_RDONLY)
     try:
-        with open(log_file, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
+        pos = os.lseek(fd, 0, os.SEEK_END)
+        chunks = []
+        newlines = 0
         
-        filtered_lines = []
+        # One newline more than the lines wanted means the first line is complete
+        while pos > 0 and newlines <= n_lines:
+            size = min(TAIL_CHUNK_SIZE, pos)
+            pos -= size
+            os.lseek(fd, pos, os.SEEK_SET)
+            chunk = os.read(fd, size)
+            chunks.append(chunk)
+            newlines += chunk.count(b"\n")
+    finally:
+        os.close(fd)
+    
+    data = b"".join(reversed(chunks))
+    return io.BytesIO(data).readlines()[-n_lines:]
+
+
+def filter_logs(log_file, level=None, component=None, function=None, search_term=None):
+    """Yield the log lines matching the given criteria"""
+    try:
+        # Build each filter needle once, not once per line
+        level_marker = f"| {level.upper()}" if level else None
+        component_marker = f"spotify_agent.{component}" if component else None
+        function_marker = f"| {function}" if function else None
+        search_lower = search_term.lower() if search_term else None
         
-        for line in lines:
+        for line in read_log_lines(log_file):
             # Apply filters
-            if level and f"| {level.upper()}" not in line:
+            if level_marker and level_marker not in line:
                 continue
             
-            if component and f"spotify_agent.{component}" not in line:
+            if component_marker and component_marker not in line:
                 continue
             
-            if function and f"| {function}" not in line:
+            if function_marker and function_marker not in line:
                 continue
             
-            if search_term and search_term.lower() not in line.lower():
+            if search_lower and search_lower not in line.lower():
                 continue
             
-            filtered_lines.append(line)
-        
-        return filtered_lines
+            yield line
         
     except Exception as e:
         print(f"❌ Error reading log file: {e}")
-        return []
 
 
 def display_logs(lines, tail=None):
     """Display log lines with optional tail functionality"""
+    # With a tail only the last lines are kept while the lines are consumed
+    if tail and tail > 0:
+        lines = deque(lines, maxlen=tail)
+    else:
+        lines = list(lines)
+    
     if not lines:
         print("\nNo log entries found")
         return
     
-    # Apply tail if specified
-    if tail:
-        lines = lines[-tail:]
-    
     print(f"\nShowing {len(lines)} log entries:\n")
     
+    # One write for the whole block instead of a print() per line
+    output = "\n".join(line.strip() for line in lines)
+    sys.stdout.write(f"{output}\n\n")
+
+
+def count_log_lines(text, level_counts, component_counts, function_counts):
+    """Add the levels, components and activity types found in text to the counters"""
+    lines = text.split("\n")
+    levels = []
+    activities = []
+    
     for line in lines:
-        print(line.strip())
+        # Count levels
+        for level, marker in LEVEL_MARKERS:
+            if marker in line:
+                levels.append(level)
+                break
+        
+        # Count functions (API calls, USER actions, etc.)
+        for marker, activity in ACTIVITY_MARKERS:
+            if marker in line:
+                activities.append(activity)
+                break
+    
+    # Counter.update tallies a whole iterable in C
+    level_counts.update(levels)
+    function_counts.update(activities)
     
-    print("")
+    # Count components
+    component_counts.update(COMPONENT_PATTERN.search(line).group(1)
+                            for line in lines if "spotify_agent." in line)
 
 
-def show_log_summary(log_file):
-    """Show a summary of log entries by level and component"""
+def _load_summary_cache(cache_path, st):
+    """Load cached summary counts if they still describe the start of the log file"""
     try:
-        with open(log_file, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-        
-        # Count by level
-        level_counts = {"ERROR": 0, "WARNING": 0, "INFO": 0, "DEBUG": 0}
-        
-        # Count by component
-        component_counts = {}
-        
-        # Count by function
-        function_counts = {}
-        
-        for line in lines:
-            # Count levels
-            for level in level_counts:
-                if f"| {level}" in line:
-                    level_counts[level] += 1
-                    break
-            
-            # Count components
-            if "spotify_agent." in line:
-                parts = line.split("spotify_agent.")
-                if len(parts) > 1:
-                    component = parts[1].split()[0].split("|")[0].strip()
-                    component_counts[component] = component_counts.get(component, 0) + 1
-            
-            # Count functions (API calls, USER actions, etc.)
-            if "API CALL" in line:
-                function_counts["API Calls"] = function_counts.get("API Calls", 0) + 1
-            elif "USER ACTION" in line:
-                function_counts["User Actions"] = function_counts.get("User Actions", 0) + 1
-            elif "PERFORMANCE" in line:
-                function_counts["Performance Metrics"] = function_counts.get("Performance Metrics", 0) + 1
-            elif "ERROR" in line:
-                function_counts["Errors"] = function_counts.get("Errors", 0) + 1
-        
-        print(f"\n📊 Log Summary for {log_file}")
-        print("=" * 50)
-        
-        print("\n🎯 Log Levels:")
-        for level, count in level_counts.items():
-            if count > 0:
-                print(f"  {level}: {count}")
-        
-        print("\n🧩 Components:")
-        for component, count in sorted(component_counts.items()):
-            if count > 0:
-                print(f"  {component}: {count}")
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    
+    # Log files are only appended to; a new inode or a smaller file means it was
+    # rotated or rewritten and has to be counted again
+    if (cached.get("version") != SUMMARY_CACHE_VERSION or cached.get("inode") != st.st_ino
+            or cached.get("offset", 0) > st.st_size):
+        return None
+    return cached
+
+
+def _save_summary_cache(cache_path, cache):
+    """Write summary counts next to the log file, ignoring read-only directories"""
+    tmp_path = f"{cache_path}.tmp"
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(cache, f)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+
+
+def summarize_log_file(log_file):
+    """
+    Count log entries by level, component and activity type
+    
+    Counts for complete lines are cached in a sibling .summary.json file, so
+    later calls only read the bytes appended since.
+    
+    Returns:
+        tuple: (level_counts, component_counts, function_counts) Counters
+    """
+    cache_path = log_file + SUMMARY_CACHE_SUFFIX
+    
+    with open(log_file, 'rb') as f:
+        st = os.fstat(f.fileno())
+        cached = _load_summary_cache(cache_path, st)
+        head = f.readline(SUMMARY_HEAD_BYTES).decode('latin-1')
+        if cached and cached.get("head") != head:
+            cached = None
         
-        print("\n⚡ Activity Types:")
-        for activity, count in sorted(function_counts.items()):
-            if count > 0:
-                print(f"  {activity}: {count}")
+        offset = 0
+        level_counts, component_counts, function_counts = Counter(), Counter(), Counter()
+        if cached:
+            offset = cached["offset"]
+            level_counts.update(cached["levels"])
+            component_counts.update(cached["components"])
+            function_counts.update(cached["functions"])
         
-        print("=" * 50)
+        f.seek(offset)
+        new_data = f.read()
+    
+    # Only complete lines go into the cache; a line still being written is
+    # counted for this call only
+    complete_end = new_data.rfind(b"\n") + 1
+    if complete_end:
+        count_log_lines(str(new_data[:complete_end], 'utf-8', 'replace'),
+                        level_counts, component_counts, function_counts)
+        _save_summary_cache(cache_path, {
+            "version": SUMMARY_CACHE_VERSION,
+            "inode": st.st_ino,
+            "head": head,
+            "offset": offset + complete_end,
+            "levels": level_counts,
+            "components": component_counts,
+            "functions": function_counts,
+        })
+    
+    if complete_end < len(new_data):
+        count_log_lines(str(new_data[complete_end:], 'utf-8', 'replace'),
+                        level_counts, component_counts, function_counts)
+    
+    return level_counts, component_counts, function_counts
+
+
+def summarize_log_files(log_files):
+    """
+    Count log entries across several log files, one worker process per file
+    
+    Returns:
+        tuple: (level_counts, component_counts, function_counts) Counters
+    """
+    level_counts, component_counts, function_counts = Counter(), Counter(), Counter()
+    
+    # Each file is counted independently, so spread them over the CPU cores
+    with ProcessPoolExecutor() as executor:
+        for levels, components, functions in executor.map(summarize_log_file, log_files):
+            level_counts.update(levels)
+            component_counts.update(components)
+            function_counts.update(functions)
+    
+    return level_counts, component_counts, function_counts
+
+
+def print_log_summary(title, level_counts, component_counts, function_counts):
+    """Print summary counts by level, component and activity type"""
+    print(f"\n📊 Log Summary for {title}")
+    print("=" * 50)
+    
+    print("\n🎯 Log Levels:")
+    for level in LOG_LEVELS:
+        if level_counts[level] > 0:
+            print(f"  {level}: {level_counts[level]}")
+    
+    print("\n🧩 Components:")
+    for component, count in sorted(component_counts.items()):
+        if count > 0:
+            print(f"  {component}: {count}")
+    
+    print("\n⚡ Activity Types:")
+    for activity, count in sorted(function_counts.items()):
+        if count > 0:
+            print(f"  {activity}: {count}")
+    
+    print("=" * 50)
+
+
+def show_log_summary(log_file):
+    """Show a summary of log entries by level and component"""
+    try:
+        print_log_summary(log_file, *summarize_log_file(log_file))
         
     except Exception as e:
         print(f"❌ Error analyzing log file: {e}")
 
 
-def main():
-    """Main function for log viewer"""
+def show_all_logs_summary(log_files):
+    """Show a combined summary of log entries across all log files"""
+    try:
+        print_log_summary(f"{len(log_files)} log files", *summarize_log_files(log_files))
+        
+    except Exception as e:
+        print(f"❌ Error analyzing log files: {e}")
+
+
+def _build_parser():
+    """Build the command line parser for the log viewer"""
     parser = argparse.ArgumentParser(description="Spotify Agent Log Viewer")
     parser.add_argument("--level", choices=["DEBUG", "INFO", "WARNING", "ERROR"], 
                        help="Filter by log level")
@@ -160,10 +362,19 @@ def main():
     parser.add_argument("--search", help="Search for specific text")
     parser.add_argument("--tail", type=int, help="Show last N lines")
     parser.add_argument("--summary", action="store_true", help="Show log summary")
+    parser.add_argument("--summary-all", action="store_true", help="Show a combined summary of all log files")
     parser.add_argument("--list", action="store_true", help="List available log files")
     parser.add_argument("--file", help="Specific log file to view")
-    
-    args = parser.parse_args()
+    return parser
+
+
+# Built once at import; main() only parses
+_PARSER = _build_parser()
+
+
+def main():
+    """Main function for log viewer"""
+    args = _PARSER.parse_args()
     
     # List files if requested
     if args.list:
@@ -175,6 +386,11 @@ def main():
     if not log_files:
         return
     
+    # Combined summary across every log file
+    if args.summary_all:
+        show_all_logs_summary(log_files)
+        return
+    
     # Select log file
     if args.file:
         if not os.path.exists(args.file):
@@ -191,6 +407,17 @@ def main():
         show_log_summary(selected_file)
         return
     
+    # Without filters only the last lines are needed, so skip scanning the file
+    no_filters = not (args.level or args.component or args.function or args.search)
+    if args.tail and args.tail > 0 and no_filters:
+        try:
+            tail_lines = read_tail_bytes(selected_file, args.tail)
+        except OSError as e:
+            print(f"❌ Error reading log file: {e}")
+            return
+        display_logs([line.decode('utf-8', 'replace') for line in tail_lines])
+        return
+    
     # Filter and display logs
     filtered_lines = filter_logs(
         selected_file,